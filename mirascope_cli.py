@@ -19,13 +19,13 @@ from src.tools.file_create import file_create
 from src.tools.file_read import file_read
 from src.tools.file_edit import file_edit
 from src.tools.execute_bash import execute_bash
-from src.tools.screenshot import screenshot
+from src.tools.screenshot import screenshot, wait_for_screenshot
 from src.tools.plan import plan
 from src.tools.summarize_conversation import (
     summarize_conversation,
     generate_conversation_summary,
 )
-from src.tools.browse_internet import browse_internet
+from src.tools.browse_internet import browse_internet, browse_internet_batch
 from src.tools.estimate_tokens import (
     estimate_tokens_from_messages,
     format_token_estimate,
@@ -50,6 +50,7 @@ ALL_TOOLS = {
     "screenshot": screenshot,
     "plan": plan,
     "browse_internet": browse_internet,
+    "browse_internet_batch": browse_internet_batch,
     "clarify": clarify,
     "summarize_conversation": summarize_conversation,
     "speak": speak,
@@ -337,9 +338,15 @@ def cli() -> None:
                             is_computer_use_screenshot = (
                                 result.name == "computer_use"
                                 and isinstance(result.result, str)
-                                and result.result.endswith(".png")
+                                and result.result.endswith((".png", ".jpg"))
                             )
                             if is_screenshot or is_computer_use_screenshot:
+                                # computer_use screenshots may still be saving
+                                save_error = wait_for_screenshot(result.result)
+                                if save_error:
+                                    print(save_error)
+                                    loaded_images.append(llm.Text(text=save_error))
+                                    continue
                                 print("Adding result image to tool outputs")
                                 loaded_images.append(llm.Text(text = f'--- Screenshot saved at: {result.result}'))
                                 loaded_images.append(llm.Image.from_file(result.result))
@@ -1,10 +1,130 @@
 from mirascope import llm
 import requests
-from bs4 import BeautifulSoup, Comment
-from urllib.parse import urlparse, urljoin
+from bs4 import BeautifulSoup, CData, Comment, NavigableString, Tag
+from urllib.parse import urlparse, urljoin, urlunparse, parse_qsl, urlencode
 import re
 import time
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer lxml's C parser when installed: it tokenizes several times faster than
+# the pure-Python html.parser, which shortens the extraction step that follows
+# every fetch (and that browse_internet_batch runs on its worker threads).
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Non-visible / non-content elements removed before extraction
+_DROP_TAGS = (
+    "script",
+    "style",
+    "noscript",
+    "iframe",
+    "svg",
+    "canvas",
+    "head",
+    "header",
+    "footer",
+    "nav",
+    "aside",
+    "form",
+    "button",
+    "input",
+    "select",
+    "textarea",
+)
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+_MAIN_CONTENT_RE = re.compile(r"content|main|article", re.I)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Tags whose text is emitted as a structured block by _walk_structure
+_BLOCK_TAGS = _HEADING_TAGS | {"p", "li", "a", "pre", "code", "blockquote"}
+# String types that get_text() considers visible text
+_TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Content types we are willing to extract text from
+_TEXT_CONTENT_TYPES = ("text/html", "text/plain", "application/xhtml", "application/xml")
+
+
+def _format_block(element: Tag, text: str, raw_text: str, url: str) -> str:
+    """Format one structural tag given its stripped and raw text content."""
+    name = element.name
+    if name in _HEADING_TAGS:
+        return f"\n{'#' * int(name[1])} {text}" if text else ""
+    if name == "p":
+        return f"\n{text}" if text else ""
+    if name == "li":
+        return f"  • {text}" if text else ""
+    if name == "a":
+        href = element.get("href", "")
+        if text and href and not href.startswith(("#", "javascript:")):
+            if url and not href.startswith(("http://", "https://")):
+                href = urljoin(url, href)
+            return f"[{text}]({href})"
+        return ""
+    if name in ("pre", "code"):
+        raw_text = raw_text.strip()
+        return f"\n```\n{raw_text}\n```" if raw_text else ""
+    # blockquote
+    return f"\n> {text}" if text else ""
+
+
+def _format_table(element: Tag) -> str:
+    """Render a table as pipe-separated rows."""
+    table_text: list[str] = []
+    for row in element.find_all("tr"):
+        cells = row.find_all(["td", "th"])
+        row_text = " | ".join(c.get_text(strip=True) for c in cells)
+        if row_text.strip():
+            table_text.append(f"| {row_text} |")
+    return "\n" + "\n".join(table_text) if table_text else ""
+
+
+def _walk_structure(target: Tag, url: str) -> list[str]:
+    """Return the structured text blocks found under ``target``, in document order.
+
+    Every text node is visited exactly once.  Each block tag reserves its
+    output slot when entered and records where its text starts; when the tag
+    is left, its text is joined from the strings collected since then.  This
+    replaces a get_text() call per block tag, which re-walked the subtree once
+    for every enclosing heading, paragraph or list item.
+    """
+    blocks: list[str] = []
+    raw: list[str] = []       # visible text nodes, in document order
+    stripped: list[str] = []  # the same nodes, stripped of whitespace
+
+    stack: list = list(reversed(target.contents))
+    while stack:
+        node = stack.pop()
+
+        # Leaving a block tag: fill its reserved slot
+        if isinstance(node, tuple):
+            slot, start, element = node
+            blocks[slot] = _format_block(
+                element, "".join(stripped[start:]), "".join(raw[start:]), url
+            )
+            continue
+
+        if isinstance(node, NavigableString):
+            if type(node) in _TEXT_STRING_TYPES:
+                raw.append(str(node))
+                stripped.append(node.strip())
+            continue
+
+        if node.name in _BLOCK_TAGS:
+            blocks.append("")
+            stack.append((len(blocks) - 1, len(raw), node))
+        elif node.name == "table":
+            blocks.append(_format_table(node))
+
+        stack.extend(reversed(node.contents))
+
+    return [block for block in blocks if block]
 
 
 def _extract_text(html_content: str, url: str = "", max_length: int = 10000) -> str:
@@ -19,29 +139,10 @@ def _extract_text(html_content: str, url: str = "", max_length: int = 10000) ->
         Clean structured text content truncated to max_length
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
 
         # Remove non-visible / non-content elements
-        for tag in soup(
-            [
-                "script",
-                "style",
-                "noscript",
-                "iframe",
-                "svg",
-                "canvas",
-                "head",
-                "header",
-                "footer",
-                "nav",
-                "aside",
-                "form",
-                "button",
-                "input",
-                "select",
-                "textarea",
-            ]
-        ):
+        for tag in soup(_DROP_TAGS):
             tag.decompose()
 
         # Remove HTML comments
@@ -49,9 +150,7 @@ def _extract_text(html_content: str, url: str = "", max_length: int = 10000) ->
             comment.extract()
 
         # Remove hidden elements
-        for tag in soup.find_all(
-            attrs={"style": re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")}
-        ):
+        for tag in soup.find_all(attrs={"style": _HIDDEN_STYLE_RE}):
             tag.decompose()
         for tag in soup.find_all(attrs={"hidden": True}):
             tag.decompose()
@@ -74,58 +173,14 @@ def _extract_text(html_content: str, url: str = "", max_length: int = 10000) ->
             soup.find("main")
             or soup.find("article")
             or soup.find("div", {"role": "main"})
-            or soup.find("div", {"id": re.compile(r"content|main|article", re.I)})
-            or soup.find("div", {"class": re.compile(r"content|main|article", re.I)})
+            or soup.find("div", {"id": _MAIN_CONTENT_RE})
+            or soup.find("div", {"class": _MAIN_CONTENT_RE})
         )
 
         target = main_content if main_content else soup.body if soup.body else soup
 
         # ── Walk relevant tags and preserve basic structure ──
-        for element in target.descendants:
-            if element.name in ("h1", "h2", "h3", "h4", "h5", "h6"):
-                level = int(element.name[1])
-                text = element.get_text(strip=True)
-                if text:
-                    parts.append(f"\n{'#' * level} {text}")
-
-            elif element.name == "p":
-                text = element.get_text(strip=True)
-                if text:
-                    parts.append(f"\n{text}")
-
-            elif element.name in ("li",):
-                text = element.get_text(strip=True)
-                if text:
-                    parts.append(f"  • {text}")
-
-            elif element.name == "a":
-                text = element.get_text(strip=True)
-                href = element.get("href", "")
-                if text and href and not href.startswith(("#", "javascript:")):
-                    if url and not href.startswith(("http://", "https://")):
-                        href = urljoin(url, href)
-                    parts.append(f"[{text}]({href})")
-
-            elif element.name in ("pre", "code"):
-                text = element.get_text()
-                if text.strip():
-                    parts.append(f"\n```\n{text.strip()}\n```")
-
-            elif element.name == "blockquote":
-                text = element.get_text(strip=True)
-                if text:
-                    parts.append(f"\n> {text}")
-
-            elif element.name == "table":
-                rows = element.find_all("tr")
-                table_text: list[str] = []
-                for row in rows:
-                    cells = row.find_all(["td", "th"])
-                    row_text = " | ".join(c.get_text(strip=True) for c in cells)
-                    if row_text.strip():
-                        table_text.append(f"| {row_text} |")
-                if table_text:
-                    parts.append("\n" + "\n".join(table_text))
+        parts.extend(_walk_structure(target, url))
 
         result = "\n".join(parts).strip()
 
@@ -136,7 +191,7 @@ def _extract_text(html_content: str, url: str = "", max_length: int = 10000) ->
             result = "\n".join(line for line in lines if line)
 
         # Collapse excessive blank lines
-        result = re.sub(r"\n{3,}", "\n\n", result)
+        result = _BLANK_LINES_RE.sub("\n\n", result)
 
         if len(result) > max_length:
             # Try to truncate at a sentence boundary
@@ -156,38 +211,48 @@ def _extract_text(html_content: str, url: str = "", max_length: int = 10000) ->
 
 
 # ── Rotating User-Agents ──
-_USER_AGENTS = [
+_USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
-]
+)
 
 _MAX_RETRIES = 2
+_MAX_BATCH_WORKERS = 8
 _RETRY_BACKOFF = 1.5  # seconds; multiplied each retry
 
+# ── Page cache (normalised URL -> (final URL, extracted text)) ──
+# The "Content from" preamble depends on the URL as requested, so it is
+# built per call rather than cached.
+_CACHE_MAX_ENTRIES = 128
+_page_cache: "OrderedDict[str, tuple[str, str]]" = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Referer": "https://www.google.com/",
+    "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "cross-site",
+    "Sec-Fetch-User": "?1",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0",
+}
+
 
 def _build_headers() -> dict[str, str]:
     """Return realistic browser headers with a random User-Agent."""
-    return {
-        "User-Agent": random.choice(_USER_AGENTS),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Referer": "https://www.google.com/",
-        "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-        "Sec-Ch-Ua-Mobile": "?0",
-        "Sec-Ch-Ua-Platform": '"Windows"',
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "cross-site",
-        "Sec-Fetch-User": "?1",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Cache-Control": "max-age=0",
-    }
+    return {"User-Agent": random.choice(_USER_AGENTS), **_BASE_HEADERS}
 
 
 def _validate_url(url: str) -> str | None:
@@ -211,6 +276,47 @@ def _validate_url(url: str) -> str | None:
     return None
 
 
+def _normalize_url(url: str) -> str:
+    """Return a cache key for a URL.
+
+    Lowercases the scheme and host, drops the fragment, strips a trailing
+    slash from the path, and removes ``utm_*`` tracking parameters so that
+    trivially different links to the same page share a cache entry.
+    """
+    parsed = urlparse(url)
+    query = urlencode(
+        [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if not k.lower().startswith("utm_")]
+    )
+    path = parsed.path.rstrip("/")
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, parsed.params, query, ""))
+
+
+def _cache_get(key: str) -> tuple[str, str] | None:
+    """Return a cached page and mark it as most recently used."""
+    with _page_cache_lock:
+        result = _page_cache.get(key)
+        if result is not None:
+            _page_cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key: str, result: tuple[str, str]) -> None:
+    """Insert a page, evicting the least recently used entry when full."""
+    with _page_cache_lock:
+        _page_cache[key] = result
+        _page_cache.move_to_end(key)
+        if len(_page_cache) > _CACHE_MAX_ENTRIES:
+            _page_cache.popitem(last=False)
+
+
+def _format_page(url: str, final_url: str, content: str) -> str:
+    """Prefix extracted page text with where it came from."""
+    preamble = f"Content from: {final_url}"
+    if final_url != url:
+        preamble += f"  (redirected from {url})"
+    return f"{preamble}\n{'─' * 60}\n\n{content}"
+
+
 def _fetch_with_retries(url: str, session: requests.Session) -> requests.Response:
     """Fetch a URL with automatic retries on transient failures."""
     last_exception: Exception | None = None
@@ -257,21 +363,8 @@ def _fetch_with_retries(url: str, session: requests.Session) -> requests.Respons
     raise requests.exceptions.RequestException(f"Failed to fetch {url} after {_MAX_RETRIES + 1} attempts")
 
 
-@llm.tool
-def browse_internet(url: str) -> str:
-    """Browse a webpage and extract its text content.
-
-    Fetches the given URL with browser-like headers and returns the readable
-    text content of the page.  Automatically retries on transient server errors
-    or rate limiting.
-
-    Args:
-        url: The URL to browse.  If the scheme is omitted, https:// is assumed.
-
-    Returns:
-        Structured text extracted from the page, or a human-readable error
-        message starting with "Error:" if the page could not be fetched.
-    """
+def _browse(url: str) -> str:
+    """Fetch a single URL and return its extracted text or an "Error:" message."""
     # ── Normalise URL ──
     url = url.strip()
     if url and not url.startswith(("http://", "https://")) and "." in url and " " not in url:
@@ -281,6 +374,11 @@ def browse_internet(url: str) -> str:
     if validation_error:
         return validation_error
 
+    cache_key = _normalize_url(url)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return _format_page(url, *cached)
+
     session = requests.Session()
     session.headers.update(_build_headers())
 
@@ -289,7 +387,7 @@ def browse_internet(url: str) -> str:
 
         # Detect content type
         content_type = response.headers.get("Content-Type", "")
-        if not any(ct in content_type for ct in ("text/html", "text/plain", "application/xhtml", "application/xml")):
+        if not any(ct in content_type for ct in _TEXT_CONTENT_TYPES):
             size = response.headers.get("Content-Length", "unknown")
             return (
                 f"Error: The URL returned non-text content.\n"
@@ -315,13 +413,13 @@ def browse_internet(url: str) -> str:
                 "The page may rely on JavaScript to render content."
             )
 
-        # Build a useful preamble
         final_url = response.url  # after redirects
-        preamble = f"Content from: {final_url}"
-        if final_url != url:
-            preamble += f"  (redirected from {url})"
 
-        return f"{preamble}\n{'─' * 60}\n\n{content}"
+        # Only successful extractions are cached; honour no-store
+        if "no-store" not in response.headers.get("Cache-Control", "").lower():
+            _cache_put(cache_key, (final_url, content))
+
+        return _format_page(url, final_url, content)
 
     except requests.exceptions.Timeout:
         return (
@@ -354,4 +452,55 @@ def browse_internet(url: str) -> str:
     except Exception as e:
         return f"Error: Unexpected error for {url}: {type(e).__name__}: {str(e)}"
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+@llm.tool
+def browse_internet(url: str) -> str:
+    """Browse a webpage and extract its text content.
+
+    Fetches the given URL with browser-like headers and returns the readable
+    text content of the page.  Automatically retries on transient server errors
+    or rate limiting.
+
+    Args:
+        url: The URL to browse.  If the scheme is omitted, https:// is assumed.
+
+    Returns:
+        Structured text extracted from the page, or a human-readable error
+        message starting with "Error:" if the page could not be fetched.
+    """
+    return _browse(url)
+
+
+@llm.tool
+def browse_internet_batch(urls: list[str]) -> str:
+    """Browse several webpages concurrently and extract their text content.
+
+    Prefer this over repeated browse_internet calls when several pages are
+    needed: the pages are fetched in parallel, so the total wait is roughly
+    that of the slowest page rather than the sum of all of them.
+
+    Args:
+        urls: The URLs to browse.  If the scheme is omitted, https:// is assumed.
+
+    Returns:
+        The extracted text of each page, in the same order as ``urls``.  Pages
+        that could not be fetched are reported with an "Error:" message.
+    """
+    if not urls:
+        return "Error: No URLs provided."
+
+    # Fetch each distinct URL once; concurrent duplicates would all miss the
+    # page cache and hit the site again
+    unique_urls = list(dict.fromkeys(urls))
+    workers = min(_MAX_BATCH_WORKERS, len(unique_urls))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        by_url = dict(zip(unique_urls, pool.map(_browse, unique_urls)))
+    results = [by_url[url] for url in urls]
+
+    sections = [
+        f"[{i}/{len(urls)}] {url}\n{result}"
+        for i, (url, result) in enumerate(zip(urls, results), start=1)
+    ]
+    return f"\n\n{'═' * 60}\n\n".join(sections)
@@ -1,25 +1,25 @@
 from mirascope import llm
 from pydantic import Field
-import os
-import uuid
-import subprocess
+import base64
+import functools
+import atexit
 import shutil
 
-from PIL import Image
-
 from src.tools.screenshot import (
+    _PowerShellSession,
+    _add_type_cached,
     detect_os,
-    linux_to_windows_path,
-    take_screenshot_wsl,
-    take_screenshot_mss,
     resize_to_1_megapixel,
     _apply_coordinate_grid,
-    _get_logical_screen_size,
-    MSS_AVAILABLE,
+    _capture_screen,
+    save_screenshot_async,
+    _screenshot_name,
+    _ensure_dir,
+    SCREENSHOT_DIR,
 )
 
-PROJECT_ROOT = os.getcwd()
-POWERSHELL = "/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe"
+# The platform cannot change while the process runs; detect it once
+_OS_TYPE = detect_os()
 
 
 # ---------------------------------------------------------------------------
@@ -33,29 +33,16 @@ def _to_int_or_none(val):
     return int(val)
 
 
-def _run_powershell(script: str, timeout: int = 15) -> str:
-    """Write a PS1 script to a temp file and execute it. Returns stdout."""
-    tmp_dir = os.path.join(PROJECT_ROOT, ".tmp")
-    os.makedirs(tmp_dir, exist_ok=True)
-    ps_path = os.path.join(tmp_dir, f"cu_{uuid.uuid4().hex[:8]}.ps1")
-
-    with open(ps_path, "w", encoding="utf-8") as f:
-        f.write(script)
+def _run_powershell(script: str, timeout: int = 15, forms: bool = False) -> str:
+    """Run a script in a persistent PowerShell session. Returns stdout.
 
-    try:
-        ps_win = linux_to_windows_path(ps_path)
-        result = subprocess.run(
-            [POWERSHELL, "-ExecutionPolicy", "Bypass", "-File", ps_win],
-            capture_output=True,
-            timeout=timeout,
-        )
-        stderr = result.stderr.decode("utf-8", errors="ignore")
-        if result.returncode != 0:
-            raise RuntimeError(stderr)
-        return result.stdout.decode("utf-8", errors="ignore").strip()
-    finally:
-        if os.path.exists(ps_path):
-            os.unlink(ps_path)
+    Mouse helpers use a session that never loads System.Windows.Forms: WinForms
+    makes its host process DPI-aware, which would switch SetCursorPos to
+    physical pixels (see _get_logical_screen_size). Clipboard and SendKeys
+    helpers pass ``forms=True`` to run in a separate session that loads it.
+    """
+    session = _FORMS_PS if forms else _INPUT_PS
+    return session.run(script, timeout)
 
 
 # ---------------------------------------------------------------------------
@@ -63,82 +50,114 @@ def _run_powershell(script: str, timeout: int = 15) -> str:
 # ---------------------------------------------------------------------------
 
 def _take_screenshot() -> str:
-    """Take a screenshot and return the relative path."""
-    screenshots_dir = os.path.join(PROJECT_ROOT, "screenshot")
-    os.makedirs(screenshots_dir, exist_ok=True)
-    name = f"{uuid.uuid4().hex[:8]}.png"
-    path = os.path.join(screenshots_dir, name)
-
-    os_type = detect_os()
-    if os_type == "wsl":
-        take_screenshot_wsl(path)
-    elif MSS_AVAILABLE:
-        take_screenshot_mss(path)
-    else:
-        raise RuntimeError("mss library not available. Install with: pip install mss")
+    """Take a screenshot and return the relative path.
+
+    The processed image is written in the background; call
+    ``wait_for_screenshot`` with the returned path before reading the file.
+    """
+    name = _screenshot_name()
+    path = str(_ensure_dir(SCREENSHOT_DIR) / name)
 
-    with Image.open(path) as img:
-        orig_w, orig_h = img.size
-        logical_w, logical_h = _get_logical_screen_size(os_type, orig_w, orig_h)
-        img = resize_to_1_megapixel(img)
-        img = _apply_coordinate_grid(img, logical_w, logical_h)
-        img.save(path, "PNG")
+    img, logical_w, logical_h = _capture_screen(_OS_TYPE)
+    img = resize_to_1_megapixel(img)
+    img = _apply_coordinate_grid(img, logical_w, logical_h)
 
-    return f"screenshot/{name}"
+    rel_path = f"screenshot/{name}"
+    save_screenshot_async(img, path)
+    return rel_path
 
 
 # ---------------------------------------------------------------------------
-# Win32 C# stub (shared by all WSL mouse/keyboard helpers)
+# Win32 C# stub and persistent sessions (shared by all WSL helpers)
 # ---------------------------------------------------------------------------
 
-_WIN32_STUB = r"""
-Add-Type @"
+_WIN32_STUB = _add_type_cached("WinInput", r"""
 using System;
 using System.Runtime.InteropServices;
 public class WinInput {
     [DllImport("user32.dll")] public static extern bool SetCursorPos(int X, int Y);
     [DllImport("user32.dll")] public static extern void mouse_event(int dwFlags, int dx, int dy, int dwData, IntPtr extra);
+    [DllImport("user32.dll")] public static extern void keybd_event(byte bVk, byte bScan, int dwFlags, IntPtr dwExtraInfo);
+    [DllImport("winmm.dll")] public static extern uint timeBeginPeriod(uint uPeriod);
+}
+""")
+
+# Start-Sleep / Thread.Sleep round up to the ~15.6 ms system timer tick unless
+# the timer resolution is raised; 1 ms makes the short sleeps below accurate.
+_TIMER_RESOLUTION = "[void][WinInput]::timeBeginPeriod(1)\n"
+
+# Mouse actions are defined once per session as PowerShell functions, so each
+# action sends a one-line call (e.g. "Move-WinCursor 512 384") instead of a
+# full script.
+_PS_FUNCTIONS = r"""
+function Move-WinCursor([int]$x, [int]$y) {
+    [void][WinInput]::SetCursorPos($x, $y)
+}
+function Invoke-WinClick([int]$x, [int]$y, [int]$down, [int]$up, [int]$clicks) {
+    [void][WinInput]::SetCursorPos($x, $y)
+    [System.Threading.Thread]::Sleep(50)
+    for ($i = 0; $i -lt $clicks; $i++) {
+        [WinInput]::mouse_event($down, 0, 0, 0, [IntPtr]::Zero)
+        [System.Threading.Thread]::Sleep(30)
+        [WinInput]::mouse_event($up, 0, 0, 0, [IntPtr]::Zero)
+        [System.Threading.Thread]::Sleep(30)
+    }
+}
+function Invoke-WinScroll([int]$x, [int]$y, [int]$flag, [int]$delta) {
+    [void][WinInput]::SetCursorPos($x, $y)
+    [System.Threading.Thread]::Sleep(50)
+    [WinInput]::mouse_event($flag, 0, 0, $delta, [IntPtr]::Zero)
+}
+function Invoke-WinDrag([int[]]$path) {
+    # $path is a flat x0, y0, x1, y1, ... list; the first point is the start
+    [void][WinInput]::SetCursorPos($path[0], $path[1])
+    [System.Threading.Thread]::Sleep(50)
+    [WinInput]::mouse_event(0x0002, 0, 0, 0, [IntPtr]::Zero)
+    [System.Threading.Thread]::Sleep(50)
+    for ($i = 2; $i -lt $path.Length; $i += 2) {
+        [void][WinInput]::SetCursorPos($path[$i], $path[$i + 1])
+        [System.Threading.Thread]::Sleep(5)
+    }
+    [WinInput]::mouse_event(0x0004, 0, 0, 0, [IntPtr]::Zero)
+}
+function Invoke-WinFindCursor {
+    # VK_LCONTROL = 0xA2 ; KEYEVENTF_KEYUP = 0x0002
+    [WinInput]::keybd_event(0xA2, 0, 0, [IntPtr]::Zero)
+    [WinInput]::keybd_event(0xA2, 0, 2, [IntPtr]::Zero)
+    [System.Threading.Thread]::Sleep(100)
+    [WinInput]::keybd_event(0xA2, 0, 0, [IntPtr]::Zero)
+    [WinInput]::keybd_event(0xA2, 0, 2, [IntPtr]::Zero)
 }
-"@
 """
 
+# Loaded once per session instead of being prepended to every script
+_INPUT_PS = _PowerShellSession(init_script=_WIN32_STUB + _TIMER_RESOLUTION + _PS_FUNCTIONS)
+_FORMS_PS = _PowerShellSession(init_script="Add-Type -AssemblyName System.Windows.Forms")
+atexit.register(_INPUT_PS.close)
+atexit.register(_FORMS_PS.close)
+
 
 # ---------------------------------------------------------------------------
 # WSL mouse helpers
 # ---------------------------------------------------------------------------
 
+_CLICK_FLAGS = {
+    "left":   (0x0002, 0x0004),
+    "right":  (0x0008, 0x0010),
+    "middle": (0x0020, 0x0040),
+}
+_DRAG_STEPS = 20
+
+
 def _wsl_mouse_move(x: int, y: int) -> str:
-    script = _WIN32_STUB + f"""
-[WinInput]::SetCursorPos({x}, {y})
-Write-Host "OK"
-"""
-    _run_powershell(script)
+    _run_powershell(f"Move-WinCursor {x} {y}")
     return f"Moved mouse to ({x}, {y})"
 
 
 def _wsl_mouse_click(x: int, y: int, button: str = "left", double: bool = False) -> str:
-    flags = {
-        "left":   (0x0002, 0x0004),
-        "right":  (0x0008, 0x0010),
-        "middle": (0x0020, 0x0040),
-    }
-    down, up = flags.get(button, (0x0002, 0x0004))
+    down, up = _CLICK_FLAGS.get(button, _CLICK_FLAGS["left"])
     clicks = 2 if double else 1
-    click_block = "\n".join([
-        f"    [WinInput]::mouse_event({down}, 0, 0, 0, [IntPtr]::Zero)",
-        f"    Start-Sleep -Milliseconds 30",
-        f"    [WinInput]::mouse_event({up}, 0, 0, 0, [IntPtr]::Zero)",
-        f"    Start-Sleep -Milliseconds 30",
-    ])
-    script = _WIN32_STUB + f"""
-[WinInput]::SetCursorPos({x}, {y})
-Start-Sleep -Milliseconds 50
-for ($i = 0; $i -lt {clicks}; $i++) {{
-{click_block}
-}}
-Write-Host "OK"
-"""
-    _run_powershell(script)
+    _run_powershell(f"Invoke-WinClick {x} {y} {down} {up} {clicks}")
     label = "Double-clicked" if double else "Clicked"
     return f"{label} {button} at ({x}, {y})"
 
@@ -153,33 +172,17 @@ def _wsl_scroll(x: int, y: int, direction: str, amount: int) -> str:
     else:  # left
         flag, delta = 0x1000, -120 * amount
 
-    script = _WIN32_STUB + f"""
-[WinInput]::SetCursorPos({x}, {y})
-Start-Sleep -Milliseconds 50
-[WinInput]::mouse_event({flag}, 0, 0, {delta}, [IntPtr]::Zero)
-Write-Host "OK"
-"""
-    _run_powershell(script)
+    _run_powershell(f"Invoke-WinScroll {x} {y} {flag} {delta}")
     return f"Scrolled {direction} {amount} step(s) at ({x}, {y})"
 
 
 def _wsl_drag(start_x: int, start_y: int, end_x: int, end_y: int) -> str:
-    script = _WIN32_STUB + f"""
-[WinInput]::SetCursorPos({start_x}, {start_y})
-Start-Sleep -Milliseconds 50
-[WinInput]::mouse_event(0x0002, 0, 0, 0, [IntPtr]::Zero)
-Start-Sleep -Milliseconds 50
-$steps = 20
-for ($i = 1; $i -le $steps; $i++) {{
-    $px = [int]({start_x} + ({end_x} - {start_x}) * $i / $steps)
-    $py = [int]({start_y} + ({end_y} - {start_y}) * $i / $steps)
-    [WinInput]::SetCursorPos($px, $py)
-    Start-Sleep -Milliseconds 10
-}}
-[WinInput]::mouse_event(0x0004, 0, 0, 0, [IntPtr]::Zero)
-Write-Host "OK"
-"""
-    _run_powershell(script)
+    # Interpolate in Python so PowerShell only replays a flat list of moves
+    path = [start_x, start_y]
+    for i in range(1, _DRAG_STEPS + 1):
+        path.append(round(start_x + (end_x - start_x) * i / _DRAG_STEPS))
+        path.append(round(start_y + (end_y - start_y) * i / _DRAG_STEPS))
+    _run_powershell(f"Invoke-WinDrag @({','.join(map(str, path))})")
     return f"Dragged from ({start_x}, {start_y}) to ({end_x}, {end_y})"
 
 
@@ -187,34 +190,32 @@ Write-Host "OK"
 # WSL keyboard helpers
 # ---------------------------------------------------------------------------
 
+_MODIFIER_MAP = {"ctrl": "^", "control": "^", "alt": "%", "shift": "+"}
+_KEY_MAP = {
+    "enter": "{ENTER}", "return": "{ENTER}",
+    "escape": "{ESCAPE}", "esc": "{ESCAPE}",
+    "tab": "{TAB}",
+    "backspace": "{BACKSPACE}",
+    "delete": "{DELETE}", "del": "{DELETE}",
+    "insert": "{INSERT}",
+    "home": "{HOME}", "end": "{END}",
+    "pageup": "{PGUP}", "page_up": "{PGUP}",
+    "pagedown": "{PGDN}", "page_down": "{PGDN}",
+    "up": "{UP}", "down": "{DOWN}", "left": "{LEFT}", "right": "{RIGHT}",
+    "f1": "{F1}", "f2": "{F2}", "f3": "{F3}", "f4": "{F4}",
+    "f5": "{F5}", "f6": "{F6}", "f7": "{F7}", "f8": "{F8}",
+    "f9": "{F9}", "f10": "{F10}", "f11": "{F11}", "f12": "{F12}",
+    "space": " ", "caps_lock": "{CAPSLOCK}", "print_screen": "{PRTSC}",
+    "windows": "^{ESC}",
+}
+
+
 def _key_to_sendkeys(key: str) -> str:
     """Convert a friendly key name/combo to PowerShell SendKeys notation."""
-    modifier_map = {"ctrl": "^", "control": "^", "alt": "%", "shift": "+"}
-    key_map = {
-        "enter": "{ENTER}", "return": "{ENTER}",
-        "escape": "{ESCAPE}", "esc": "{ESCAPE}",
-        "tab": "{TAB}",
-        "backspace": "{BACKSPACE}",
-        "delete": "{DELETE}", "del": "{DELETE}",
-        "insert": "{INSERT}",
-        "home": "{HOME}", "end": "{END}",
-        "pageup": "{PGUP}", "page_up": "{PGUP}",
-        "pagedown": "{PGDN}", "page_down": "{PGDN}",
-        "up": "{UP}", "down": "{DOWN}", "left": "{LEFT}", "right": "{RIGHT}",
-        "f1": "{F1}", "f2": "{F2}", "f3": "{F3}", "f4": "{F4}",
-        "f5": "{F5}", "f6": "{F6}", "f7": "{F7}", "f8": "{F8}",
-        "f9": "{F9}", "f10": "{F10}", "f11": "{F11}", "f12": "{F12}",
-        "space": " ", "caps_lock": "{CAPSLOCK}", "print_screen": "{PRTSC}",
-        "windows": "^{ESC}",
-    }
-
-    parts = key.lower().split("+")
-    modifiers = ""
-    for part in parts[:-1]:
-        modifiers += modifier_map.get(part, "")
-    main = parts[-1]
-    if main in key_map:
-        return modifiers + key_map[main]
+    *mods, main = key.lower().split("+")
+    modifiers = "".join(_MODIFIER_MAP.get(part, "") for part in mods)
+    if main in _KEY_MAP:
+        return modifiers + _KEY_MAP[main]
     elif len(main) == 1:
         return modifiers + main
     else:
@@ -223,26 +224,15 @@ def _key_to_sendkeys(key: str) -> str:
 
 def _wsl_type(text: str) -> str:
     """Type text via clipboard paste (handles all characters reliably)."""
-    tmp_dir = os.path.join(PROJECT_ROOT, ".tmp")
-    os.makedirs(tmp_dir, exist_ok=True)
-    txt_path = os.path.join(tmp_dir, f"type_{uuid.uuid4().hex[:8]}.txt")
-
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write(text)
-
-    win_txt = linux_to_windows_path(txt_path)
+    # Sent in-band as base64 so any character survives without a temp file
+    encoded = base64.b64encode(text.encode("utf-8")).decode("ascii")
     script = f"""
-Add-Type -AssemblyName System.Windows.Forms
-$text = [System.IO.File]::ReadAllText("{win_txt}", [System.Text.Encoding]::UTF8)
+$text = [System.Text.Encoding]::UTF8.GetString([System.Convert]::FromBase64String('{encoded}'))
 [System.Windows.Forms.Clipboard]::SetText($text)
 [System.Windows.Forms.SendKeys]::SendWait("^v")
 Write-Host "OK"
 """
-    try:
-        _run_powershell(script)
-    finally:
-        if os.path.exists(txt_path):
-            os.unlink(txt_path)
+    _run_powershell(script, forms=True)
     return f"Typed {len(text)} character(s)"
 
 
@@ -251,35 +241,17 @@ def _wsl_key(key: str) -> str:
     # Escape double-quotes in the sendkeys string for embedding in PS
     sendkeys_escaped = sendkeys.replace('"', '`"')
     script = f"""
-Add-Type -AssemblyName System.Windows.Forms
 [System.Windows.Forms.SendKeys]::SendWait("{sendkeys_escaped}")
 Write-Host "OK"
 """
-    _run_powershell(script)
+    _run_powershell(script, forms=True)
     return f"Pressed key: {key}"
 
 
 def _wsl_find_cursor() -> str:
     """Press Left Ctrl twice via keybd_event to trigger the Windows cursor-locator animation."""
-    # VK_LCONTROL = 0xA2 ; KEYEVENTF_KEYUP = 0x0002
     # Using keybd_event (not SendKeys) because SendKeys cannot press a modifier key alone.
-    script = r"""
-Add-Type @"
-using System;
-using System.Runtime.InteropServices;
-public class KeyHelper {
-    [DllImport("user32.dll")]
-    public static extern void keybd_event(byte bVk, byte bScan, int dwFlags, IntPtr dwExtraInfo);
-}
-"@
-[KeyHelper]::keybd_event(0xA2, 0, 0, [IntPtr]::Zero)
-[KeyHelper]::keybd_event(0xA2, 0, 2, [IntPtr]::Zero)
-Start-Sleep -Milliseconds 100
-[KeyHelper]::keybd_event(0xA2, 0, 0, [IntPtr]::Zero)
-[KeyHelper]::keybd_event(0xA2, 0, 2, [IntPtr]::Zero)
-Write-Host "OK"
-"""
-    _run_powershell(script)
+    _run_powershell("Invoke-WinFindCursor")
     return "Pressed Left Ctrl twice — cursor location animation triggered"
 
 
@@ -287,6 +259,7 @@ Write-Host "OK"
 # Non-WSL helpers (pyautogui)
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def _get_pyautogui():
     try:
         import pyautogui
@@ -350,6 +323,53 @@ def _other_find_cursor() -> str:
     return "Pressed Left Ctrl twice — cursor location animation triggered"
 
 
+# ---------------------------------------------------------------------------
+# Action dispatch (platform chosen once at import)
+# ---------------------------------------------------------------------------
+
+if _OS_TYPE == "wsl":
+    _mouse_move, _mouse_click, _scroll, _drag = _wsl_mouse_move, _wsl_mouse_click, _wsl_scroll, _wsl_drag
+    _type, _key, _find_cursor = _wsl_type, _wsl_key, _wsl_find_cursor
+else:
+    _mouse_move, _mouse_click, _scroll, _drag = _other_mouse_move, _other_mouse_click, _other_scroll, _other_drag
+    _type, _key, _find_cursor = _other_type, _other_key, _other_find_cursor
+
+_HANDLERS = {
+    "screenshot": lambda **_: _take_screenshot(),
+    "mouse_move": lambda x, y, **_: _mouse_move(x, y),
+    "left_click": lambda x, y, **_: _mouse_click(x, y, "left"),
+    "right_click": lambda x, y, **_: _mouse_click(x, y, "right"),
+    "double_click": lambda x, y, **_: _mouse_click(x, y, "left", double=True),
+    "middle_click": lambda x, y, **_: _mouse_click(x, y, "middle"),
+    "scroll": lambda x, y, scroll_direction, scroll_amount, **_: _scroll(
+        x, y, scroll_direction, scroll_amount
+    ),
+    "left_click_drag": lambda x, y, end_x, end_y, **_: _drag(x, y, end_x, end_y),
+    "type": lambda text, **_: _type(text),
+    "key": lambda key, **_: _key(key),
+    "find_cursor": lambda **_: _find_cursor(),
+}
+
+# Required arguments per action, with the error returned when one is missing
+_XY = ("x", "y")
+_REQUIRED_ARGS = {
+    "mouse_move": (_XY, "Error: x and y are required for mouse_move"),
+    "left_click": (_XY, "Error: x and y are required for left_click"),
+    "right_click": (_XY, "Error: x and y are required for right_click"),
+    "double_click": (_XY, "Error: x and y are required for double_click"),
+    "middle_click": (_XY, "Error: x and y are required for middle_click"),
+    "scroll": (_XY, "Error: x and y are required for scroll"),
+    "left_click_drag": (
+        ("x", "y", "end_x", "end_y"),
+        "Error: x, y, end_x, and end_y are required for left_click_drag",
+    ),
+    "type": (("text",), "Error: text is required for type action"),
+    "key": (("key",), "Error: key is required for key action"),
+}
+
+_SCROLL_DIRECTIONS = ("up", "down", "left", "right")
+
+
 # ---------------------------------------------------------------------------
 # Main tool
 # ---------------------------------------------------------------------------
@@ -401,94 +421,22 @@ def computer_use(
     if scroll_amount is None:
         scroll_amount = 3
 
-    try:
-        os_type = detect_os()
-        is_wsl = os_type == "wsl"
-
-        match action:
-            case "screenshot":
-                return _take_screenshot()
-
-            case "mouse_move":
-                if x is None or y is None:
-                    return "Error: x and y are required for mouse_move"
-                return _wsl_mouse_move(x, y) if is_wsl else _other_mouse_move(x, y)
-
-            case "left_click":
-                if x is None or y is None:
-                    return "Error: x and y are required for left_click"
-                return (
-                    _wsl_mouse_click(x, y, "left")
-                    if is_wsl
-                    else _other_mouse_click(x, y, "left")
-                )
-
-            case "right_click":
-                if x is None or y is None:
-                    return "Error: x and y are required for right_click"
-                return (
-                    _wsl_mouse_click(x, y, "right")
-                    if is_wsl
-                    else _other_mouse_click(x, y, "right")
-                )
-
-            case "double_click":
-                if x is None or y is None:
-                    return "Error: x and y are required for double_click"
-                return (
-                    _wsl_mouse_click(x, y, "left", double=True)
-                    if is_wsl
-                    else _other_mouse_click(x, y, "left", double=True)
-                )
-
-            case "middle_click":
-                if x is None or y is None:
-                    return "Error: x and y are required for middle_click"
-                return (
-                    _wsl_mouse_click(x, y, "middle")
-                    if is_wsl
-                    else _other_mouse_click(x, y, "middle")
-                )
-
-            case "scroll":
-                if x is None or y is None:
-                    return "Error: x and y are required for scroll"
-                if scroll_direction not in ("up", "down", "left", "right"):
-                    return "Error: scroll_direction must be up, down, left, or right"
-                return (
-                    _wsl_scroll(x, y, scroll_direction, scroll_amount)
-                    if is_wsl
-                    else _other_scroll(x, y, scroll_direction, scroll_amount)
-                )
-
-            case "left_click_drag":
-                if any(v is None for v in (x, y, end_x, end_y)):
-                    return "Error: x, y, end_x, and end_y are required for left_click_drag"
-                return (
-                    _wsl_drag(x, y, end_x, end_y)
-                    if is_wsl
-                    else _other_drag(x, y, end_x, end_y)
-                )
-
-            case "type":
-                if not text:
-                    return "Error: text is required for type action"
-                return _wsl_type(text) if is_wsl else _other_type(text)
-
-            case "key":
-                if not key:
-                    return "Error: key is required for key action"
-                return _wsl_key(key) if is_wsl else _other_key(key)
-
-            case "find_cursor":
-                return _wsl_find_cursor() if is_wsl else _other_find_cursor()
-
-            case _:
-                return (
-                    f"Unknown action: '{action}'. Valid actions: screenshot, mouse_move, "
-                    "left_click, right_click, double_click, middle_click, scroll, "
-                    "left_click_drag, type, key, find_cursor"
-                )
+    handler = _HANDLERS.get(action)
+    if handler is None:
+        return f"Unknown action: '{action}'. Valid actions: {', '.join(_HANDLERS)}"
 
+    args = {
+        "x": x, "y": y, "end_x": end_x, "end_y": end_y, "text": text, "key": key,
+        "scroll_direction": scroll_direction, "scroll_amount": scroll_amount,
+    }
+    if action in _REQUIRED_ARGS:
+        names, error = _REQUIRED_ARGS[action]
+        if any(args[name] is None or args[name] == "" for name in names):
+            return error
+    if action == "scroll" and scroll_direction not in _SCROLL_DIRECTIONS:
+        return "Error: scroll_direction must be up, down, left, or right"
+
+    try:
+        return handler(**args)
     except Exception as e:
         return f"Error performing '{action}': {e}"
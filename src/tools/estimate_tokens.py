@@ -1,7 +1,29 @@
 """Token estimation utility using tiktoken."""
+import functools
+
 import tiktoken
 
 
+# Token usage bar, prebuilt once and sliced per call
+_BAR_LENGTH = 30
+_BAR_FULL = '█' * _BAR_LENGTH
+_BAR_EMPTY = '░' * _BAR_LENGTH
+_BAR_COLORS = ("\033[92m", "\033[93m", "\033[91m")  # green, yellow, red
+_RESET = "\033[0m"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Return the (cached) tiktoken encoding for a model.
+
+    Falls back to cl100k_base if the model is unknown to tiktoken.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def estimate_tokens(text: str, model: str = "gpt-4") -> int:
     """Estimate the number of tokens in a text string.
     
@@ -14,14 +36,8 @@ def estimate_tokens(text: str, model: str = "gpt-4") -> int:
     """
     if not text:
         return 0
-        
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except KeyError:
-        # Fallback to cl100k_base encoding if model not found
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+
+    return len(_get_encoding(model).encode(text))
 
 
 def estimate_tokens_from_messages(messages: list, model: str = "gpt-4") -> int:
@@ -34,15 +50,20 @@ def estimate_tokens_from_messages(messages: list, model: str = "gpt-4") -> int:
     Returns:
         Total number of tokens
     """
+    # Get text content from each message
+    texts = [
+        str(msg.content)
+        for msg in messages
+        if hasattr(msg, 'content') and msg.content
+    ]
+
+    # encode_batch spreads the messages over a thread pool; tiktoken's Rust
+    # tokenizer releases the GIL, so they are encoded in parallel
     total_tokens = 0
-    for msg in messages:
-        # Get text content from message
-        text = ""
-        if hasattr(msg, 'content') and msg.content:
-            text = str(msg.content)
-        
-        total_tokens += estimate_tokens(text, model)
-        
+    if texts:
+        encoded = _get_encoding(model).encode_batch(texts)
+        total_tokens = sum(len(tokens) for tokens in encoded)
+
     # Add overhead for message formatting (approximate)
     # Typically ~5 tokens per message for metadata/formatting
     total_tokens += len(messages) * 5
@@ -61,20 +82,12 @@ def format_token_estimate(count: int, max_tokens: int = 8196) -> str:
         Formatted string with token count and visual bar
     """
     percentage = min(100, (count / max_tokens) * 100)
-    
-    # Create visual bar
-    bar_length = 30
-    filled_length = int(bar_length * count / max_tokens)
-    bar = '█' * filled_length + '░' * (bar_length - filled_length)
-    
-    # Color coding based on usage
-    if percentage < 50:
-        color = "\033[92m"  # Green
-    elif percentage < 80:
-        color = "\033[93m"  # Yellow
-    else:
-        color = "\033[91m"  # Red
-    
-    reset = "\033[0m"
-    
-    return f"{color}{count:,}{reset} / {max_tokens:,} tokens [{bar}] ({percentage:.1f}%)"
+
+    # Create visual bar by slicing prebuilt strings
+    filled_length = min(_BAR_LENGTH, (_BAR_LENGTH * count) // max_tokens)
+    bar = _BAR_FULL[:filled_length] + _BAR_EMPTY[filled_length:]
+
+    # Color coding based on usage: green < 50% <= yellow < 80% <= red
+    color = _BAR_COLORS[(percentage >= 50) + (percentage >= 80)]
+
+    return f"{color}{count:,}{_RESET} / {max_tokens:,} tokens [{bar}] ({percentage:.1f}%)"
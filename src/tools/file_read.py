@@ -1,6 +1,8 @@
 from mirascope import llm
 import os
 
+from src.tools.screenshot import wait_for_screenshot
+
 # Get the current working directory (hard constraint: operations limited to this folder)
 # Use CWD as the root to avoid accidentally accessing files elsewhere
 PROJECT_ROOT = os.getcwd()
@@ -45,6 +47,9 @@ def file_read(path: str, start_line: int = 1, end_line: int | None = None):
         return error_message
     
     try:
+        # Let a screenshot that is still being written in the background finish
+        wait_for_screenshot(path)
+
         if not os.path.exists(path):
             return f"Error: File not found at {path}"
 
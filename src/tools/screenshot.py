@@ -3,12 +3,24 @@ import os
 import sys
 import platform
 import subprocess
-import uuid
-import shutil
+import secrets
+import base64
+import bisect
+import functools
+import hashlib
+import io
+import queue
+import atexit
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from datetime import datetime
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 
 PROJECT_ROOT = os.getcwd()
+SCREENSHOT_DIR = Path(PROJECT_ROOT) / "screenshot"
+POWERSHELL = "/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe"
 
 # Try importing mss for cross‑platform screenshots
 try:
@@ -18,6 +30,13 @@ except ImportError:
     MSS_AVAILABLE = False
 
 
+@functools.cache
+def _ensure_dir(path: Path) -> Path:
+    """Create ``path`` if needed and return it; the mkdir runs once per process."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def linux_to_windows_path(linux_path: str) -> str:
     """Convert a Linux path from /mnt/c/... to Windows C:\\... format."""
     if linux_path.startswith('/mnt/'):
@@ -29,8 +48,9 @@ def linux_to_windows_path(linux_path: str) -> str:
     return linux_path
 
 
+@functools.cache
 def detect_os() -> str:
-    """Detect if we are running on Windows, macOS, Linux, or WSL."""
+    """Detect if we are running on Windows, macOS, Linux, or WSL (cached; it cannot change)."""
     if sys.platform == "win32":
         return "windows"
     elif sys.platform == "darwin":
@@ -41,6 +61,38 @@ def detect_os() -> str:
         return "linux"
 
 
+# Resampling filter for the final, fractional part of the downscale. LANCZOS
+# keeps small UI text sharpest; BICUBIC or HAMMING are cheaper alternatives.
+DOWNSCALE_FILTER = Image.Resampling.LANCZOS
+_MAX_REDUCE_FACTOR = 4
+
+# Below this size the host<->GPU copies cost more than the resize itself
+_GPU_RESIZE_MIN_PIXELS = 4_000_000
+
+
+def _resize_gpu(img: Image.Image, size: tuple[int, int]) -> Image.Image | None:
+    """
+    Downscale on the GPU with antialiased bicubic, or return None if unavailable.
+
+    Only used when torch has already been imported by the process (e.g. a
+    local model backend) and CUDA is available. It never imports torch itself,
+    since that alone takes seconds.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None or img.mode != "RGB" or not torch.cuda.is_available():
+        return None
+    try:
+        import numpy as np
+        from torch.nn import functional as F
+
+        x = torch.from_numpy(np.asarray(img)).cuda().permute(2, 0, 1).unsqueeze(0).float()
+        y = F.interpolate(x, size=(size[1], size[0]), mode="bicubic", antialias=True)
+        out = y.squeeze(0).permute(1, 2, 0).round_().clamp_(0, 255).to(torch.uint8).cpu()
+        return Image.fromarray(out.numpy(), "RGB")
+    except Exception:
+        return None
+
+
 def resize_to_1_megapixel(img: Image.Image) -> Image.Image:
     """Resize an image to ~1 MP while preserving aspect ratio."""
     width, height = img.size
@@ -54,57 +106,321 @@ def resize_to_1_megapixel(img: Image.Image) -> Image.Image:
     new_width = int(width * scale_factor)
     new_height = int(height * scale_factor)
 
-    return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    if scale_factor < 0.5 and current_pixels >= _GPU_RESIZE_MIN_PIXELS:
+        resized = _resize_gpu(img, (new_width, new_height))
+        if resized is not None:
+            return resized
 
+    # Take the integer part of the downscale with reduce() (a C box filter,
+    # far cheaper than LANCZOS over the full-size image), then resample only
+    # the remaining fractional factor with DOWNSCALE_FILTER.
+    reduce_factor = min(int(1 / scale_factor), _MAX_REDUCE_FACTOR)
+    if reduce_factor > 1:
+        img = img.reduce(reduce_factor)
 
-def crop_to_bbox(img: Image.Image, bbox: dict) -> Image.Image:
-    """Crop image to a bounding box (supports two bbox formats)."""
-    width, height = img.size
+    return img.resize((new_width, new_height), DOWNSCALE_FILTER)
 
-    if all(k in bbox for k in ['x1', 'y1', 'x2', 'y2']):
-        left = max(0, bbox['x1'])
-        top = max(0, bbox['y1'])
-        right = min(width, bbox['x2'])
-        bottom = min(height, bbox['y2'])
-    elif all(k in bbox for k in ['x', 'y', 'width', 'height']):
-        left = max(0, bbox['x'])
-        top = max(0, bbox['y'])
-        right = min(width, bbox['x'] + bbox['width'])
-        bottom = min(height, bbox['y'] + bbox['height'])
-    else:
-        raise ValueError(
-            "bbox must contain either 'x','y','width','height' or 'x1','y1','x2','y2'"
-        )
+
+# Screenshots sent to the model are JPEG: encoding is several times faster
+# than optimised PNG and the files are far smaller. PNG is kept for bbox
+# crops, where the agent is zooming in on detail and lossless matters.
+SCREENSHOT_FORMAT = "JPEG"
+SCREENSHOT_QUALITY = 85
+_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png"}
+
+
+def _screenshot_name(fmt: str = SCREENSHOT_FORMAT) -> str:
+    """Return a random file name with the extension matching ``fmt``."""
+    return f"{secrets.token_hex(4)}{_EXTENSIONS[fmt]}"
+
+
+def _save_screenshot(img: Image.Image, path: str, fmt: str = SCREENSHOT_FORMAT) -> None:
+    """Save a processed screenshot in ``fmt``.
+
+    JPEG is written progressive and with optimised Huffman tables. For PNG,
+    ``optimize=True`` makes zlib use its best compression level, and images
+    with at most 256 distinct colours are stored as a palette PNG, which is
+    lossless for them and several times smaller still.
+    """
+    if fmt == "JPEG":
+        img.save(path, "JPEG", quality=SCREENSHOT_QUALITY, optimize=True, progressive=True)
+        return
+    if img.mode == "RGB" and img.getcolors(maxcolors=256) is not None:
+        img = img.convert("P", palette=Image.Palette.ADAPTIVE, colors=256)
+    img.save(path, "PNG", optimize=True)
+
+
+# Encoding the image is the slowest step of a screenshot, and the caller only
+# needs the path back, so save_screenshot_async() writes it on a worker thread.
+# Files are written under a temporary name and renamed into place, so the
+# final path never holds a partial image. Readers call wait_for_screenshot().
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-save")
+_PENDING_SAVES: dict[str, Future] = {}
+
+
+def _write_screenshot(img: Image.Image, path: str, fmt: str) -> None:
+    tmp_path = f"{path}.part"
+    try:
+        _save_screenshot(img, tmp_path, fmt)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _save_done(key: str, future: Future) -> None:
+    """Drop a finished save from the pending table and report failures."""
+    _PENDING_SAVES.pop(key, None)
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Error saving screenshot {key}: {future.exception()}")
+
+
+def save_screenshot_async(img: Image.Image, path: str, fmt: str = SCREENSHOT_FORMAT) -> None:
+    """Save a processed screenshot to ``path`` in the background (see wait_for_screenshot)."""
+    key = os.path.abspath(path)
+    future = _SAVE_POOL.submit(_write_screenshot, img, path, fmt)
+    _PENDING_SAVES[key] = future
+    # Registered after the insert: if the save already finished, the callback
+    # runs right here and still finds (and removes) the entry
+    future.add_done_callback(functools.partial(_save_done, key))
+
+
+def wait_for_screenshot(path: str) -> str | None:
+    """Wait for a background save of ``path`` to finish.
+
+    Returns:
+        None when the file is ready to read, otherwise an error message.
+    """
+    future = _PENDING_SAVES.get(os.path.abspath(path))
+    if future is not None:
+        try:
+            future.result()
+        except Exception as e:
+            return f"Error saving screenshot {path}: {e}"
+    if not os.path.exists(path):
+        return f"Error: screenshot {path} could not be saved"
+    return None
+
+
+def _bbox_to_box(bbox: dict, width: int, height: int) -> tuple[int, int, int, int]:
+    """Clamp a bbox (either format) to ``width`` x ``height``; return (left, top, right, bottom)."""
+    try:
+        x1, y1, x2, y2 = bbox['x1'], bbox['y1'], bbox['x2'], bbox['y2']
+    except KeyError:
+        try:
+            x1, y1 = bbox['x'], bbox['y']
+            x2, y2 = x1 + bbox['width'], y1 + bbox['height']
+        except KeyError:
+            raise ValueError(
+                "bbox must contain either 'x','y','width','height' or 'x1','y1','x2','y2'"
+            ) from None
+
+    left = x1 if x1 > 0 else 0
+    top = y1 if y1 > 0 else 0
+    right = x2 if x2 < width else width
+    bottom = y2 if y2 < height else height
 
     if left >= right or top >= bottom:
         raise ValueError(
             f"Invalid bbox coordinates: left={left}, top={top}, right={right}, bottom={bottom}"
         )
 
-    return img.crop((left, top, right, bottom))
+    return left, top, right, bottom
 
 
-def take_screenshot_mss(path: str) -> None:
-    """Take a screenshot using the mss library (cross‑platform)."""
-    with mss() as sct:
-        sct.shot(mon=-1, output=path)
+def crop_to_bbox(img: Image.Image, bbox: dict) -> Image.Image:
+    """Crop image to a bounding box (supports two bbox formats)."""
+    return img.crop(_bbox_to_box(bbox, *img.size))
+
+
+# mss instances hold a display connection / device context, so one is kept
+# per thread (they are not thread-safe) instead of being opened per capture.
+_mss_local = threading.local()
+_mss_instances = []
+
+
+def _get_mss():
+    """Return this thread's mss instance, creating it on first use."""
+    sct = getattr(_mss_local, "sct", None)
+    if sct is None:
+        sct = _mss_local.sct = mss()
+        _mss_instances.append(sct)
+    return sct
+
 
+@atexit.register
+def _close_mss() -> None:
+    for sct in _mss_instances:
+        try:
+            sct.close()
+        except Exception:
+            pass
 
-def _get_windows_temp_dir() -> str:
+
+def take_screenshot_mss() -> Image.Image:
+    """Take a screenshot of all monitors using the mss library (cross‑platform).
+
+    The raw BGRA buffer is wrapped directly into a PIL image, so no PNG is
+    encoded or decoded on the way.
     """
-    Retrieve the Windows %TEMP% directory from WSL using PowerShell.
-    Returns the path in Windows format, e.g. ``C:\\Users\\you\\AppData\\Local\\Temp``.
+    return _grab_mss()[0]
+
+
+def _grab_mss(bbox: dict | None = None) -> tuple[Image.Image, int, int]:
+    """
+    Grab all monitors, or only ``bbox`` within them, with mss.
+
+    Returns ``(image, screen_w, screen_h)`` where the screen size is that of
+    the full capture area, which ``bbox`` is relative to and clamped against.
+    """
+    sct = _get_mss()
+    area = sct.monitors[0]
+    if bbox is not None:
+        left, top, right, bottom = _bbox_to_box(bbox, area["width"], area["height"])
+        region = {
+            "left": area["left"] + left,
+            "top": area["top"] + top,
+            "width": right - left,
+            "height": bottom - top,
+        }
+    else:
+        region = area
+    shot = sct.grab(region)
+    img = Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+    return img, area["width"], area["height"]
+
+
+# ---------------------------------------------------------------------------
+# Persistent PowerShell sessions (WSL)
+# ---------------------------------------------------------------------------
+
+# Every script is sent as one base64-encoded line so multi-line constructs
+# (here-strings, loops) survive PowerShell's line-by-line stdin reader. Errors
+# are caught and reported on a marker line, followed by the end sentinel.
+_PS_WRAPPER = (
+    "try {{ $ErrorActionPreference = 'Stop'; "
+    "Invoke-Expression ([System.Text.Encoding]::UTF8.GetString("
+    "[System.Convert]::FromBase64String('{encoded}'))) }} "
+    "catch {{ Write-Output \"<<<ERR {token}>>> $($_.Exception.Message -replace '[\\r\\n]+', ' ')\" }} "
+    "finally {{ $ErrorActionPreference = 'Continue' }}; "
+    "Write-Output '<<<END {token}>>>'\n"
+)
+
+
+def _pump_lines(stream, lines: queue.Queue) -> None:
+    """Forward lines from a pipe into a queue; ``None`` marks end of stream."""
+    for line in iter(stream.readline, b""):
+        lines.put(line)
+    lines.put(None)
+
+
+class _PowerShellSession:
+    """A long-lived ``powershell.exe`` fed scripts over stdin.
+
+    Starting PowerShell (process creation, CLR init, Add-Type compilation)
+    costs hundreds of milliseconds, which used to be paid on every mouse or
+    keyboard action. The process is started lazily, runs ``init_script``
+    once, and is restarted after a timeout or crash. Calls are serialised.
     """
-    powershell_path = "/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe"
-    result = subprocess.run(
-        [powershell_path, "-NoProfile", "-Command", "[System.IO.Path]::GetTempPath()"],
-        capture_output=True,
-        timeout=10,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Failed to obtain Windows TEMP directory")
-    win_temp = result.stdout.decode("utf-8", errors="ignore").strip()
-    return win_temp.rstrip("\\")
+
+    def __init__(self, init_script: str = ""):
+        self._init_script = init_script
+        self._proc: subprocess.Popen | None = None
+        self._lines: queue.Queue | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        self._proc = subprocess.Popen(
+            [POWERSHELL, "-ExecutionPolicy", "Bypass", "-NoLogo", "-NoProfile", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=_pump_lines, args=(self._proc.stdout, self._lines), daemon=True
+        ).start()
+        if self._init_script:
+            self._execute(self._init_script, timeout=30)
+
+    def _execute(self, script: str, timeout: float) -> str:
+        token = secrets.token_hex(16)
+        encoded = base64.b64encode(script.encode("utf-8")).decode("ascii")
+        self._proc.stdin.write(_PS_WRAPPER.format(encoded=encoded, token=token).encode("utf-8"))
+        self._proc.stdin.flush()
+
+        end_marker = f"<<<END {token}>>>"
+        err_marker = f"<<<ERR {token}>>>"
+        deadline = time.monotonic() + timeout
+        output: list[str] = []
+        error = None
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.close()
+                raise RuntimeError(f"PowerShell timed out after {timeout}s")
+            if line is None:
+                self.close()
+                raise RuntimeError("PowerShell exited unexpectedly: " + "\n".join(output))
+            text = line.decode("utf-8", errors="ignore").rstrip("\r\n")
+            if text == end_marker:
+                break
+            if text.startswith(err_marker):
+                error = text[len(err_marker):].strip()
+            else:
+                output.append(text)
+
+        if error is not None:
+            raise RuntimeError(error)
+        return "\n".join(output).rstrip()
+
+    def run(self, script: str, timeout: float = 15) -> str:
+        """Execute a script in the session and return its stdout."""
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            return self._execute(script, timeout)
+
+    def close(self) -> None:
+        """Terminate the PowerShell process, if running."""
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except OSError:
+                pass
+            self._proc = None
+
+
+def _add_type_cached(name: str, source: str) -> str:
+    """
+    Return PowerShell that loads the C# ``source`` from a DLL cached in %TEMP%.
+
+    ``name`` must be the class the source defines; it names the DLL and is
+    used to skip loading when the type is already present.
+
+    ``Add-Type -TypeDefinition`` runs the C# compiler, which is by far the
+    slowest part of starting a session. The compiled assembly is written
+    once, named after a hash of the source so edits invalidate it, and later
+    sessions just load it. Any problem with the cached file falls back to
+    compiling in memory.
+    """
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    return f"""
+$src = @"
+{source.strip()}
+"@
+$dll = Join-Path $env:TEMP 'cli-template-{name}-{digest}.dll'
+if (-not (Test-Path $dll)) {{
+    try {{ Add-Type -TypeDefinition $src -OutputAssembly $dll -OutputType Library }} catch {{ }}
+}}
+if (-not ('{name}' -as [type])) {{
+    try {{ Add-Type -Path $dll }} catch {{ Add-Type -TypeDefinition $src }}
+}}
+"""
 
 
 def _get_logical_screen_size(os_type: str, fallback_w: int, fallback_h: int) -> tuple[int, int]:
@@ -116,92 +432,48 @@ def _get_logical_screen_size(os_type: str, fallback_w: int, fallback_h: int) ->
     For example, a 2560×1600 display at 150 % scaling has logical size 1707×1067.
     Grid labels must show logical coords so the agent can use them directly.
 
-    IMPORTANT: We must NOT load System.Windows.Forms here. In .NET 4.7+ WinForms
+    IMPORTANT: We must NOT use System.Windows.Forms here. In .NET 4.7+ WinForms
     auto-enables per-monitor DPI awareness for its host process, which makes
     Screen.PrimaryScreen.Bounds return *physical* pixels — the wrong value.
-    Instead we use GetSystemMetrics(SM_CXSCREEN/SM_CYSCREEN) directly via P/Invoke
-    in a DPI-unaware PowerShell process, which always returns logical coordinates
-    matching the SetCursorPos coordinate space.
+    Instead the DPI-aware capture session scales the physical resolution by
+    96 / system DPI with MulDiv, which is exactly how Windows virtualises
+    GetSystemMetrics(SM_CXSCREEN/SM_CYSCREEN) for DPI-unaware processes such
+    as the one issuing SetCursorPos.
 
     On other platforms mss captures at the OS-reported (logical) resolution, so
     physical == logical and the fallback is always correct.
+
+    A successful lookup is cached for the session; failures are not, so a
+    later call can still succeed.
     """
-    if os_type == "wsl":
-        # Use a temp PS1 file so we can use a here-string for the C# stub.
-        # Do NOT call SetProcessDPIAware() — keeping the process DPI-unaware
-        # is what makes GetSystemMetrics return logical (virtualised) pixels.
-        ps_script = r"""
-Add-Type @"
-using System;
-using System.Runtime.InteropServices;
-public class ScreenMetrics {
-    [DllImport("user32.dll")]
-    public static extern int GetSystemMetrics(int nIndex);
-}
-"@
-$w = [ScreenMetrics]::GetSystemMetrics(0)
-$h = [ScreenMetrics]::GetSystemMetrics(1)
-Write-Output "$w $h"
-"""
-        try:
-            import uuid as _uuid
-            tmp_dir = os.path.join(PROJECT_ROOT, ".tmp")
-            os.makedirs(tmp_dir, exist_ok=True)
-            ps_path = os.path.join(tmp_dir, f"lsz_{_uuid.uuid4().hex[:8]}.ps1")
-            with open(ps_path, "w", encoding="utf-8") as f:
-                f.write(ps_script)
-            try:
-                ps_win = linux_to_windows_path(ps_path)
-                result = subprocess.run(
-                    [
-                        "/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe",
-                        "-ExecutionPolicy", "Bypass", "-NoProfile", "-File", ps_win,
-                    ],
-                    capture_output=True,
-                    timeout=10,
-                )
-                parts = result.stdout.decode("utf-8", errors="ignore").strip().split()
-                if len(parts) == 2:
-                    w, h = int(parts[0]), int(parts[1])
-                    if w > 0 and h > 0:
-                        return w, h
-            finally:
-                if os.path.exists(ps_path):
-                    os.unlink(ps_path)
-        except Exception:
-            pass
-    elif MSS_AVAILABLE:
-        try:
-            with mss() as sct:
-                m = sct.monitors[1]   # primary monitor, logical resolution
-                return m["width"], m["height"]
-        except Exception:
-            pass
-    return fallback_w, fallback_h
+    try:
+        return _query_logical_screen_size(os_type)
+    except Exception:
+        return fallback_w, fallback_h
 
 
-def take_screenshot_wsl(path: str) -> None:
-    """
-    WSL‑specific screenshot using PowerShell with DPI‑aware capture.
+@functools.lru_cache(maxsize=1)
+def _query_logical_screen_size(os_type: str) -> tuple[int, int]:
+    """Query the logical screen size; raises if it cannot be determined."""
+    if os_type == "wsl":
+        w, h = map(int, _CAPTURE_PS.run("[ScreenCapture]::GetLogicalResolution() -join ' '").split())
+    elif MSS_AVAILABLE:
+        m = _get_mss().monitors[1]   # primary monitor, logical resolution
+        w, h = m["width"], m["height"]
+    else:
+        raise RuntimeError("No way to query the logical screen size")
+    if w <= 0 or h <= 0:
+        raise RuntimeError(f"Invalid logical screen size: {w}x{h}")
+    return w, h
 
-    The image is first saved to the Windows ``%TEMP%`` directory (guaranteed
-    to be a valid Windows path), then moved back into the WSL filesystem at
-    the user‑requested ``path``.
-    """
-    temp_filename = f"capture_{uuid.uuid4().hex[:8]}.png"
-    win_temp_dir = _get_windows_temp_dir()
-    windows_output_path = os.path.join(win_temp_dir, temp_filename)
-    windows_path_escaped = windows_output_path.replace("\\", "\\\\")
 
-    drive_letter = win_temp_dir[0].lower()
-    wsl_temp_dir = f"/mnt/{drive_letter}/{win_temp_dir[3:].replace('\\\\', '/').replace('\\', '/')}"
-    temp_capture_path = os.path.join(wsl_temp_dir, temp_filename)
+_WSL_CAPTURE_QUALITY = 95
 
-    ps_script = fr"""Add-Type @"
+_SCREEN_CAPTURE_CS = r"""
 using System;
 using System.Runtime.InteropServices;
 
-public class ScreenCapture {{
+public class ScreenCapture {
     [DllImport("user32.dll")]
     public static extern bool SetProcessDPIAware();
 
@@ -214,85 +486,167 @@ public class ScreenCapture {{
     [DllImport("user32.dll")]
     public static extern int ReleaseDC(IntPtr hwnd, IntPtr hdc);
 
+    [DllImport("kernel32.dll")]
+    public static extern int MulDiv(int number, int numerator, int denominator);
+
+    public const int LOGPIXELSX = 88;
     public const int DESKTOPHORZRES = 118;
     public const int DESKTOPVERTRES = 117;
 
-    public static int[] GetPhysicalResolution() {{
+    public static int[] GetPhysicalResolution() {
         IntPtr hdc = GetDC(IntPtr.Zero);
         int w = GetDeviceCaps(hdc, DESKTOPHORZRES);
         int h = GetDeviceCaps(hdc, DESKTOPVERTRES);
         ReleaseDC(IntPtr.Zero, hdc);
-        return new int[] {{ w, h }};
-    }}
-}}
-"@
+        return new int[] { w, h };
+    }
 
-[ScreenCapture]::SetProcessDPIAware()
+    // The resolution a DPI-unaware process sees (and SetCursorPos expects)
+    public static int[] GetLogicalResolution() {
+        IntPtr hdc = GetDC(IntPtr.Zero);
+        int w = GetDeviceCaps(hdc, DESKTOPHORZRES);
+        int h = GetDeviceCaps(hdc, DESKTOPVERTRES);
+        int dpi = GetDeviceCaps(hdc, LOGPIXELSX);
+        ReleaseDC(IntPtr.Zero, hdc);
+        return new int[] { MulDiv(w, 96, dpi), MulDiv(h, 96, dpi) };
+    }
+}
+"""
+
+# Loaded once into the capture session. SetProcessDPIAware() makes the
+# session capture physical pixels, so it must stay separate from the mouse
+# session in computer_use (see _get_logical_screen_size).
+# Get-WinScreenshot encodes the capture in memory and prints it as base64,
+# followed by the logical screen size, so a screenshot is a single round trip
+# with no file on either side of the /mnt boundary.
+_CAPTURE_INIT = _add_type_cached("ScreenCapture", _SCREEN_CAPTURE_CS) + r"""
+[void][ScreenCapture]::SetProcessDPIAware()
 Add-Type -AssemblyName System.Drawing
 
-$res = [ScreenCapture]::GetPhysicalResolution()
-$width = $res[0]
-$height = $res[1]
+$jpegCodec = [System.Drawing.Imaging.ImageCodecInfo]::GetImageEncoders() | Where-Object { $_.MimeType -eq 'image/jpeg' }
+
+function Get-WinScreenshot([long]$quality, [int]$x = 0, [int]$y = 0, [int]$w = 0, [int]$h = 0) {
+    # Captures the whole screen unless a region (physical pixels) is given
+    if ($w -le 0 -or $h -le 0) {
+        $res = [ScreenCapture]::GetPhysicalResolution()
+        $x, $y, $w, $h = 0, 0, $res[0], $res[1]
+    }
+    $bitmap = New-Object System.Drawing.Bitmap($w, $h)
+    $graphics = [System.Drawing.Graphics]::FromImage($bitmap)
+    $params = New-Object System.Drawing.Imaging.EncoderParameters(1)
+    $stream = New-Object System.IO.MemoryStream
+    try {
+        $graphics.CopyFromScreen($x, $y, 0, 0, $bitmap.Size)
+        $params.Param[0] = New-Object System.Drawing.Imaging.EncoderParameter([System.Drawing.Imaging.Encoder]::Quality, $quality)
+        $bitmap.Save($stream, $jpegCodec, $params)
+        Write-Output ([System.Convert]::ToBase64String($stream.GetBuffer(), 0, $stream.Length))
+    } finally {
+        $stream.Dispose()
+        $params.Dispose()
+        $graphics.Dispose()
+        $bitmap.Dispose()
+    }
+    Write-Output ([ScreenCapture]::GetLogicalResolution() -join ' ')
+}
+"""
 
-Write-Host "Capturing at: $width x $height"
+_CAPTURE_PS = _PowerShellSession(init_script=_CAPTURE_INIT)
+atexit.register(_CAPTURE_PS.close)
 
-$bitmap = New-Object System.Drawing.Bitmap($width, $height)
-$graphics = [System.Drawing.Graphics]::FromImage($bitmap)
-$graphics.CopyFromScreen(0, 0, 0, 0, (New-Object System.Drawing.Size($width, $height)))
 
-$bitmap.Save('{windows_path_escaped}', [System.Drawing.Imaging.ImageFormat]::Png)
+def _capture_wsl(region: tuple[int, int, int, int] | None = None) -> tuple[Image.Image, int, int]:
+    """
+    Capture the screen on WSL and return ``(image, logical_w, logical_h)``.
 
-$graphics.Dispose()
-$bitmap.Dispose()
+    ``region`` is an optional ``(x, y, width, height)`` in physical pixels;
+    only that part of the screen is copied and encoded.
+
+    The capture is JPEG-encoded in memory by GDI+ (much faster than PNG) and
+    streamed back over the persistent PowerShell session's stdout as base64,
+    together with the logical screen size. Nothing touches the disk, and
+    only the first call pays for process start-up.
+    """
+    region_args = " ".join(map(str, region)) if region else ""
+    output = _CAPTURE_PS.run(
+        f"Get-WinScreenshot {_WSL_CAPTURE_QUALITY} {region_args}".rstrip(), timeout=30
+    )
+    # Everything before the size line is the image, in case the host wrapped it
+    encoded, _, size = output.rpartition("\n")
+    logical_w, logical_h = map(int, size.split())
+
+    img = Image.open(io.BytesIO(base64.b64decode("".join(encoded.split()))))
+    img.load()
+    return img, logical_w, logical_h
 
-Write-Host "Screenshot saved successfully"
-"""
 
-    temp_dir = os.path.join(PROJECT_ROOT, ".tmp")
-    os.makedirs(temp_dir, exist_ok=True)
-    ps_script_path = os.path.join(
-        temp_dir, f"screenshot_{uuid.uuid4().hex[:8]}.ps1"
+def take_screenshot_wsl() -> Image.Image:
+    """WSL‑specific screenshot using PowerShell with DPI‑aware capture."""
+    return _capture_wsl()[0]
+
+
+@functools.lru_cache(maxsize=1)
+def _query_wsl_screen_sizes() -> tuple[int, int, int, int]:
+    """Return ``(physical_w, physical_h, logical_w, logical_h)`` of the Windows screen."""
+    sizes = _CAPTURE_PS.run(
+        "([ScreenCapture]::GetPhysicalResolution() + [ScreenCapture]::GetLogicalResolution()) -join ' '"
     )
-    with open(ps_script_path, "w", encoding="utf-8") as f:
-        f.write(ps_script)
+    return tuple(map(int, sizes.split()))
 
-    try:
-        ps_script_windows = linux_to_windows_path(ps_script_path)
-        powershell_path = "/mnt/c/Windows/System32/WindowsPowerShell/v1.0/powershell.exe"
-        result = subprocess.run(
-            [powershell_path, "-ExecutionPolicy", "Bypass", "-File", ps_script_windows],
-            capture_output=True,
-            timeout=30,
-        )
 
-        stdout_text = result.stdout.decode("utf-8", errors="ignore") if result.stdout else ""
-        stderr_text = result.stderr.decode("utf-8", errors="ignore") if result.stderr else ""
+def _capture_region(os_type: str, bbox: dict) -> tuple[Image.Image, int, int, int, int]:
+    """
+    Capture only ``bbox`` (screen-capture pixels) of the screen.
+
+    Returns ``(image, screen_w, screen_h, logical_w, logical_h)``, where the
+    screen size is that of a full capture, for scaling the bbox to logical
+    coordinates. Copying just the region skips most of the capture, encode
+    and crop work for small crops.
+    """
+    if os_type == "wsl":
+        screen_w, screen_h, logical_w, logical_h = _query_wsl_screen_sizes()
+        left, top, right, bottom = _bbox_to_box(bbox, screen_w, screen_h)
+        img, _, _ = _capture_wsl((left, top, right - left, bottom - top))
+        return img, screen_w, screen_h, logical_w, logical_h
+    if not MSS_AVAILABLE:
+        raise RuntimeError("mss library not available. Install with: pip install mss")
 
-        if result.returncode != 0:
-            raise RuntimeError(f"PowerShell failed: {stderr_text}")
+    size_future = _LOOKUP_POOL.submit(_get_logical_screen_size, os_type, 0, 0)
+    img, screen_w, screen_h = _grab_mss(bbox)
+    logical_w, logical_h = size_future.result()
+    if not logical_w or not logical_h:
+        logical_w, logical_h = screen_w, screen_h
+    return img, screen_w, screen_h, logical_w, logical_h
 
-        if os.path.exists(temp_capture_path):
-            shutil.move(temp_capture_path, path)
-        else:
-            raise FileNotFoundError(
-                f"Screenshot not created at expected temp path: {temp_capture_path}"
-            )
 
-        return stdout_text
+# On other platforms the logical-size lookup is independent of the capture,
+# so it runs alongside it.
+_LOOKUP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screen-size")
 
-    finally:
-        if os.path.exists(ps_script_path):
-            os.unlink(ps_script_path)
-        if os.path.exists(temp_capture_path):
-            try:
-                os.unlink(temp_capture_path)
-            except Exception:
-                pass
+
+def _capture_screen(os_type: str) -> tuple[Image.Image, int, int]:
+    """
+    Capture the full screen and return ``(image, logical_w, logical_h)``.
+
+    On WSL the logical size comes back with the capture itself. Elsewhere it
+    is looked up concurrently with the capture and falls back to the
+    captured size when it cannot be determined.
+    """
+    if os_type == "wsl":
+        return _capture_wsl()
+    if not MSS_AVAILABLE:
+        raise RuntimeError("mss library not available. Install with: pip install mss")
+
+    size_future = _LOOKUP_POOL.submit(_get_logical_screen_size, os_type, 0, 0)
+    img = take_screenshot_mss()
+    logical_w, logical_h = size_future.result()
+    if not logical_w or not logical_h:
+        logical_w, logical_h = img.size
+    return img, logical_w, logical_h
 
 
+@functools.cache
 def _load_font(size: int = 13):
-    """Load a monospace font at the given size, falling back gracefully."""
-    from PIL import ImageFont
+    """Load a monospace font at the given size, falling back gracefully (cached per size)."""
     font_paths = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
         "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
@@ -313,68 +667,119 @@ def _load_font(size: int = 13):
         return ImageFont.load_default()
 
 
-def _apply_coordinate_grid(
-    img: Image.Image,
+@functools.lru_cache(maxsize=4)
+def _label_glyphs(size: int = 13) -> dict[str, tuple[Image.Image, float]]:
+    """
+    Pre-render the digits used in grid labels as ``(mask, advance)`` pairs.
+
+    Grid labels are always plain integers, so rasterising ten glyphs once and
+    stamping their masks is much cheaper than laying out text per label.
+    """
+    font = _load_font(size)
+    glyphs = {}
+    for ch in "0123456789-":
+        _, _, right, bottom = font.getbbox(ch)
+        mask = Image.new("L", (max(right, 1), max(bottom, 1)), 0)
+        ImageDraw.Draw(mask).text((0, 0), ch, fill=255, font=font)
+        glyphs[ch] = (mask, font.getlength(ch))
+    return glyphs
+
+
+_GRID_LINE  = (255, 80,  80,  80)   # semi-transparent red
+_GRID_LABEL = (255, 255,  0, 230)   # opaque yellow
+_GRID_SHADE = (  0,   0,  0, 180)   # dark shadow behind labels
+_GRID_STEPS = (50, 100, 150, 200, 250, 300, 500)
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_layout(
+    img_w: int,
+    img_h: int,
     screen_w: int,
     screen_h: int,
     offset_x: int = 0,
     offset_y: int = 0,
-) -> Image.Image:
+) -> tuple[tuple[list, list], ...]:
     """
-    Overlay a semi-transparent coordinate grid showing true screen pixel positions.
+    Lay out the coordinate grid for an image size as ``(lines, stamps)`` per axis.
 
-    screen_w / screen_h : dimensions of the screen region represented by the image.
-    offset_x / offset_y : screen coordinates of the image's top-left corner.
-    Labels display absolute screen coordinates so the agent can use them directly
-    for mouse actions without any conversion.
+    ``lines`` are line endpoints and ``stamps`` are ``(x, y, glyph_mask)``
+    placements for the label digits. The layout only depends on the image
+    size and the screen region it maps to, which rarely change between
+    screenshots, so it is cached and reused.
     """
-    from PIL import ImageDraw
-
-    img_w, img_h = img.size
     scale_x = screen_w / img_w
     scale_y = screen_h / img_h
 
-    # Pick a grid step (screen pixels) that gives roughly 8-14 lines per axis
-    max_dim = max(screen_w, screen_h)
-    screen_step = 500
-    for candidate in (50, 100, 150, 200, 250, 300, 500):
-        if max_dim / candidate <= 14:
-            screen_step = candidate
-            break
-
-    font = _load_font(13)
+    # Pick the smallest grid step (screen pixels) that gives at most 14 lines per axis
+    i = bisect.bisect_left(_GRID_STEPS, max(screen_w, screen_h) / 14)
+    screen_step = _GRID_STEPS[min(i, len(_GRID_STEPS) - 1)]
 
-    img_rgba = img.convert("RGBA")
-    overlay = Image.new("RGBA", (img_w, img_h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    glyphs = _label_glyphs(13)
 
-    LINE  = (255, 80,  80,  80)   # semi-transparent red
-    LABEL = (255, 255,  0, 230)   # opaque yellow
-    SHADE = (  0,   0,  0, 180)   # dark shadow behind labels
+    def stamps_for(x, y, lbl):
+        pen = x
+        for ch in lbl:
+            mask, advance = glyphs[ch]
+            yield round(pen), y, mask
+            pen += advance
 
     # Vertical lines – step through screen x-coordinates
+    lines, stamps = [], []
     screen_x = screen_step * ((offset_x // screen_step) + 1)
     while screen_x < offset_x + screen_w:
         ix = int(round((screen_x - offset_x) / scale_x))
         if 0 < ix < img_w:
-            draw.line([(ix, 0), (ix, img_h)], fill=LINE, width=1)
-            lbl = str(screen_x)
-            draw.text((ix + 3, 5), lbl, fill=SHADE, font=font)
-            draw.text((ix + 2, 4), lbl, fill=LABEL, font=font)
+            lines.append([(ix, 0), (ix, img_h)])
+            stamps.extend(stamps_for(ix + 2, 4, str(screen_x)))
         screen_x += screen_step
+    vertical = (lines, stamps)
 
     # Horizontal lines – step through screen y-coordinates
+    lines, stamps = [], []
     screen_y = screen_step * ((offset_y // screen_step) + 1)
     while screen_y < offset_y + screen_h:
         iy = int(round((screen_y - offset_y) / scale_y))
         if 0 < iy < img_h:
-            draw.line([(0, iy), (img_w, iy)], fill=LINE, width=1)
-            lbl = str(screen_y)
-            draw.text((5, iy + 3), lbl, fill=SHADE, font=font)
-            draw.text((4, iy + 2), lbl, fill=LABEL, font=font)
+            lines.append([(0, iy), (img_w, iy)])
+            stamps.extend(stamps_for(4, iy + 2, str(screen_y)))
         screen_y += screen_step
+    horizontal = (lines, stamps)
 
-    return Image.alpha_composite(img_rgba, overlay).convert("RGB")
+    return vertical, horizontal
+
+
+def _apply_coordinate_grid(
+    img: Image.Image,
+    screen_w: int,
+    screen_h: int,
+    offset_x: int = 0,
+    offset_y: int = 0,
+) -> Image.Image:
+    """
+    Overlay a semi-transparent coordinate grid showing true screen pixel positions.
+
+    screen_w / screen_h : dimensions of the screen region represented by the image.
+    offset_x / offset_y : screen coordinates of the image's top-left corner.
+    Labels display absolute screen coordinates so the agent can use them directly
+    for mouse actions without any conversion.
+
+    The grid is drawn straight onto ``img`` (modified in place and returned)
+    through an "RGBA" ImageDraw, which alpha-blends each primitive as it is
+    drawn, so only the grid's own pixels are touched.
+    """
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    img_w, img_h = img.size
+    draw = ImageDraw.Draw(img, "RGBA")
+    # Per axis: lines first, then every shadow, then every label
+    for lines, stamps in _grid_layout(img_w, img_h, screen_w, screen_h, offset_x, offset_y):
+        for line in lines:
+            draw.line(line, fill=_GRID_LINE, width=1)
+        for shift, fill in ((1, _GRID_SHADE), (0, _GRID_LABEL)):
+            for x, y, mask in stamps:
+                draw.bitmap((x + shift, y + shift), mask, fill=fill)
+    return img
 
 
 @llm.tool
@@ -389,9 +794,10 @@ def screenshot(
 
     The function automatically selects the appropriate capture method:
     - Windows / macOS / Linux → mss library
-    - WSL → PowerShell DPI‑aware capture (writes to %TEMP% first)
+    - WSL → PowerShell DPI‑aware capture (streamed back in memory)
 
-    The image is resized to ~1 MP and saved to ./screenshot/<random>.png.
+    The image is resized to ~1 MP and saved to ./screenshot/<random>.jpg
+    (.png for bbox crops).
 
     The bbox_x, bbox_y, bbox_width, and bbox_height parameters allow cropping
     to a specific region of the screen. Unless there is a clear reason to use
@@ -418,76 +824,66 @@ def screenshot(
     bbox_width = _to_int_or_none(bbox_width)
     bbox_height = _to_int_or_none(bbox_height)
 
-    screenshots_dir = os.path.join(PROJECT_ROOT, "screenshot")
-
     try:
-        random_name = f"{uuid.uuid4().hex[:8]}.png"
-        path = os.path.join(screenshots_dir, random_name)
-
-        os.makedirs(screenshots_dir, exist_ok=True)
-
         use_bbox = all(
             v is not None for v in [bbox_x, bbox_y, bbox_width, bbox_height]
         )
+        fmt = "PNG" if use_bbox else SCREENSHOT_FORMAT
+        path = str(_ensure_dir(SCREENSHOT_DIR) / _screenshot_name(fmt))
 
         # ---------- Capture ----------
         print(f"Detected OS: {os_type.upper()}")
 
-        if os_type == "wsl":
-            take_screenshot_wsl(path)
-        elif MSS_AVAILABLE:
-            take_screenshot_mss(path)
-        else:
+        if os_type != "wsl" and not MSS_AVAILABLE:
             return (
                 f"Error: mss library not available for {os_type}. "
                 "Install with: pip install mss"
             )
 
-        if not os.path.exists(path):
-            return f"Error: Screenshot file not created at {path}"
-
-        # ---------- Post‑process ----------
-        with Image.open(path) as img:
+        # Logical screen size = what mouse coordinates actually use.
+        # On WSL the capture is DPI-aware (physical pixels) but SetCursorPos
+        # uses logical pixels, so we must query them separately.
+        # With a bbox only that region is captured.
+        if use_bbox:
+            bbox = {
+                "x": bbox_x,
+                "y": bbox_y,
+                "width": bbox_width,
+                "height": bbox_height,
+            }
+            img, orig_w, orig_h, logical_w, logical_h = _capture_region(os_type, bbox)
+        else:
+            img, logical_w, logical_h = _capture_screen(os_type)
             orig_w, orig_h = img.size
-            print(f"Original image size: {orig_w}x{orig_h}")
-
-            # Logical screen size = what mouse coordinates actually use.
-            # On WSL the capture is DPI-aware (physical pixels) but SetCursorPos
-            # uses logical pixels, so we must query them separately.
-            logical_w, logical_h = _get_logical_screen_size(os_type, orig_w, orig_h)
-            print(f"Logical screen size: {logical_w}x{logical_h}")
-
-            if use_bbox:
-                bbox = {
-                    "x": bbox_x,
-                    "y": bbox_y,
-                    "width": bbox_width,
-                    "height": bbox_height,
-                }
-                img = crop_to_bbox(img, bbox)
-                # For bbox crops, scale the logical bbox coords from the DPI ratio
-                dpi_scale_x = logical_w / orig_w
-                dpi_scale_y = logical_h / orig_h
-                region_w = int(round(bbox_width  * dpi_scale_x))
-                region_h = int(round(bbox_height * dpi_scale_y))
-                off_x    = int(round(bbox_x      * dpi_scale_x))
-                off_y    = int(round(bbox_y      * dpi_scale_y))
-                print(
-                    f"Cropped to bbox: x={bbox_x}, y={bbox_y}, "
-                    f"w={bbox_width}, h={bbox_height}"
-                )
-            else:
-                region_w, region_h = logical_w, logical_h
-                off_x, off_y = 0, 0
 
-            img = resize_to_1_megapixel(img)
-            new_w, new_h = img.size
+        # ---------- Post‑process (in memory, saved once) ----------
+        print(f"Original image size: {orig_w}x{orig_h}")
+        print(f"Logical screen size: {logical_w}x{logical_h}")
+
+        if use_bbox:
+            # For bbox crops, scale the logical bbox coords from the DPI ratio
+            dpi_scale_x = logical_w / orig_w
+            dpi_scale_y = logical_h / orig_h
+            region_w = int(round(bbox_width  * dpi_scale_x))
+            region_h = int(round(bbox_height * dpi_scale_y))
+            off_x    = int(round(bbox_x      * dpi_scale_x))
+            off_y    = int(round(bbox_y      * dpi_scale_y))
             print(
-                f"Resized to ~1 MP: {new_w}x{new_h} "
-                f"({new_w * new_h} pixels)"
+                f"Cropped to bbox: x={bbox_x}, y={bbox_y}, "
+                f"w={bbox_width}, h={bbox_height}"
             )
-            img = _apply_coordinate_grid(img, region_w, region_h, off_x, off_y)
-            img.save(path, "PNG")
+        else:
+            region_w, region_h = logical_w, logical_h
+            off_x, off_y = 0, 0
+
+        img = resize_to_1_megapixel(img)
+        new_w, new_h = img.size
+        print(
+            f"Resized to ~1 MP: {new_w}x{new_h} "
+            f"({new_w * new_h} pixels)"
+        )
+        img = _apply_coordinate_grid(img, region_w, region_h, off_x, off_y)
+        _save_screenshot(img, path, fmt)
 
         return f"screenshot/{os.path.basename(path)}"
 
@@ -499,7 +895,7 @@ def screenshot(
 # Example usage (run directly for a quick test)
 # ----------------------------------------------------------------------
 if __name__ == "__main__":
-    # Basic full-screen screenshot (saved to ./screenshot/<random>.png)
+    # Basic full-screen screenshot (saved to ./screenshot/<random>.jpg)
     print(screenshot())
 
     # Screenshot with a bounding box crop (uncomment to test)
@@ -4,7 +4,7 @@ This module provides tools for listing skills and getting skill information.
 """
 
 from mirascope import llm
-from ..skills.manager import get_skill_manager, get_skill_info as manager_get_skill_info
+from ..utils.skills.manager import get_skill_manager, get_skill_info as manager_get_skill_info
 
 
 @llm.tool
@@ -57,8 +57,7 @@ def skill_search(keyword: str) -> str:
     if not results:
         return f"No skills found matching '{keyword}'. Try a different keyword."
     
-    output = f"Skills matching '{keyword}':\n\n"
-    for skill in results:
-        output += f"  - {skill['name']}: {skill.get('description', 'N/A')}\n"
+    parts = [f"Skills matching '{keyword}':\n\n"]
+    parts.extend(f"  - {skill['name']}: {skill.get('description', 'N/A')}\n" for skill in results)
     
-    return output
+    return "".join(parts)
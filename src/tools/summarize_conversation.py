@@ -1,6 +1,21 @@
 from mirascope import llm
 
 
+_SUMMARY_PROMPT_HEADER = """You are an expert conversation summarizer. Your task is to summarize the following conversation history into a concise, informative summary that preserves all important context, decisions, and progress.
+
+IMPORTANT: The summary should be written in a way that allows the assistant to "come back" to the initial state by preserving:
+1. Key facts and decisions made
+2. User preferences and requirements
+3. Progress on tasks or goals
+4. Important context about the project or topic
+5. Any pending actions or follow-ups
+
+Format your response as a well-structured summary that can be provided as context in a new conversation.
+
+Conversation history:
+"""
+
+
 @llm.tool
 def summarize_conversation(messages: list[str]) -> str:
     """Summarize a conversation history for context preservation.
@@ -21,6 +36,16 @@ def summarize_conversation(messages: list[str]) -> str:
     return "Conversation summary placeholder"
 
 
+def _format_msg(msg) -> str:
+    """Render one message as ``ROLE: text`` lines for the summary prompt."""
+    prefix = f"{msg.role.upper()}: " if hasattr(msg, 'role') else ""
+    if not hasattr(msg, 'content'):
+        return f"{prefix}{msg}\n"
+    if isinstance(msg.content, list):
+        return prefix + "".join(item.text + "\n" for item in msg.content if hasattr(item, 'text'))
+    return f"{prefix}{msg.content}\n"
+
+
 def generate_conversation_summary(messages: list) -> str:
     """Generate a summary of the conversation history using the LLM.
     
@@ -30,36 +55,11 @@ def generate_conversation_summary(messages: list) -> str:
     Returns:
         A concise summary of the conversation
     """
-    # Build the summary prompt
-    summary_prompt = """You are an expert conversation summarizer. Your task is to summarize the following conversation history into a concise, informative summary that preserves all important context, decisions, and progress.
-
-IMPORTANT: The summary should be written in a way that allows the assistant to "come back" to the initial state by preserving:
-1. Key facts and decisions made
-2. User preferences and requirements
-3. Progress on tasks or goals
-4. Important context about the project or topic
-5. Any pending actions or follow-ups
-
-Format your response as a well-structured summary that can be provided as context in a new conversation.
-
-Conversation history:
-"""
-
-    # Build message history string
-    for msg in messages:
-        if hasattr(msg, 'role'):
-            summary_prompt += f"{msg.role.upper()}: "
-        if hasattr(msg, 'content'):
-            if isinstance(msg.content, list):
-                for item in msg.content:
-                    if hasattr(item, 'text'):
-                        summary_prompt += item.text + "\n"
-            else:
-                summary_prompt += str(msg.content) + "\n"
-        else:
-            summary_prompt += str(msg) + "\n"
-    
-    summary_prompt += "\n\nPlease provide a comprehensive summary of this conversation:"
+    # Build the summary prompt in one join rather than growing a string per message
+    parts = [_SUMMARY_PROMPT_HEADER]
+    parts.extend(_format_msg(m) for m in messages)
+    parts.append("\n\nPlease provide a comprehensive summary of this conversation:")
+    summary_prompt = "".join(parts)
 
     # Use the main model to generate the summary
     model = llm.Model(
@@ -74,12 +74,11 @@ Conversation history:
         )
         
         # Collect the full response
-        summary_text = ""
+        text_chunks = []
         for stream in response.streams():
             match stream.content_type:
                 case "text":
-                    for chunk in stream:
-                        summary_text += chunk
+                    text_chunks.extend(stream)
                 case "thought":
                     # Thoughts are internal, don't include in summary
                     pass
@@ -87,7 +86,7 @@ Conversation history:
                     # Shouldn't happen for summarization
                     pass
 
-        return summary_text.strip()
+        return "".join(text_chunks).strip()
         
     except Exception as e:
         # Fallback: create a basic summary from message count
@@ -1,5 +1,28 @@
 """Utility modules for Mirascope CLI."""
 
+import importlib
+import os
+import threading
+
+# Modules that are imported later during startup (the screenshot tools, the
+# input prompt) or lazily on first use. With CLI_WARM_IMPORTS set they are
+# imported on a daemon thread as soon as the utils package loads. The main
+# thread's own imports then find them already in sys.modules, or wait on the
+# per-module import lock while the warm-up finishes.
+_WARM_IMPORTS = ("PIL.Image", "PIL.ImageDraw", "mss", "prompt_toolkit")
+
+
+def _warm_imports() -> None:
+    for name in _WARM_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+if os.environ.get("CLI_WARM_IMPORTS", "").lower() in ("1", "true", "yes"):
+    threading.Thread(target=_warm_imports, name="warm-imports", daemon=True).start()
+
 from .load_model import load_config, setup_provider, load_model, get_model
 from .load_prompts import (
     load_prompt,
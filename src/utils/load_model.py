@@ -2,15 +2,40 @@
 """Minimalist script to load an LLM model from config.yaml"""
 
 from mirascope import llm
+import copy
 import os
 import yaml
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# libyaml's C loader is many times faster than the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# config_path -> (st_mtime_ns or None if missing, parsed config)
+_config_cache: dict[str, tuple[int | None, dict]] = {}
+
 
 def load_config(config_path: str = "config.yaml") -> dict:
-    """Load configuration from config.yaml"""
+    """Load configuration from config.yaml
+
+    The parsed file is cached and only re-read when its modification time
+    changes. Each call returns its own copy, so callers may modify it.
+    """
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    cached = _config_cache.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _read_config(config_path))
+        _config_cache[config_path] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _read_config(config_path: str) -> dict:
+    """Parse config.yaml on top of the built-in defaults."""
     default_config = {
         "llm": {
             "api_base": None,
@@ -31,6 +56,7 @@ def load_config(config_path: str = "config.yaml") -> dict:
             "screenshot": True,
             "plan": True,
             "browse_internet": True,
+            "browse_internet_batch": True,
             "clarify": True,
             "summarize_conversation": True,
         },
@@ -40,7 +66,7 @@ def load_config(config_path: str = "config.yaml") -> dict:
 
     if os.path.exists(config_path):
         with open(config_path, "r", encoding="utf-8") as f:
-            loaded_config = yaml.safe_load(f)
+            loaded_config = yaml.load(f, Loader=_YamlLoader)
             if loaded_config:
                 default_config.update(loaded_config)
 
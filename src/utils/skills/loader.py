@@ -5,16 +5,58 @@ Skills are YAML-frontmatter-markdown files that define CLI tools and capabilitie
 """
 
 from mirascope import llm
+import functools
 import os
 import re
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Union
 
 
-# Get the current working directory
-PROJECT_ROOT = os.getcwd()
-SKILLS_DIR = Path(PROJECT_ROOT) / ".claude" / "skills"
+@functools.cache
+def _project_root() -> Path:
+    """The working directory, resolved on first use rather than at import time."""
+    return Path(os.getcwd())
+
+
+@functools.cache
+def _skills_dir() -> Path:
+    """The skills directory: $CLAUDE_SKILLS_DIR if set, else .claude/skills in the project."""
+    override = os.environ.get("CLAUDE_SKILLS_DIR")
+    return Path(override) if override else _project_root() / ".claude" / "skills"
+
+
+# libyaml's C loader is many times faster than the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# allowed-tools of the form "Bash(<pattern>)"; group 1 is the tool pattern
+_TOOL_PATTERN_RE = re.compile(r"\ABash\((.*)\)\Z")
+
+# (base prompt, skills dict, full prompt) of the last build_system_prompt_with_skills()
+_system_prompt_cache: Optional[tuple] = None
+
+# skills_dir -> (signature from _skills_signature, loaded skills)
+_skills_cache: Dict[str, tuple[tuple, Dict[str, Dict[str, Any]]]] = {}
+
+# prompt path -> (st_mtime_ns, text)
+_base_prompt_cache: Dict[str, tuple[int, str]] = {}
+
+
+def _read_base_prompt(path: Optional[Path] = None) -> str:
+    """Return the text of prompts/system.md ("" if missing), re-reading it only when it changes."""
+    path = path or _project_root() / "prompts" / "system.md"
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ""
+    cached = _base_prompt_cache.get(str(path))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    text = path.read_text(encoding="utf-8")
+    _base_prompt_cache[str(path)] = (mtime, text)
+    return text
 
 
 def parse_yaml_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
@@ -26,81 +68,185 @@ def parse_yaml_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     Returns:
         Tuple of (metadata_dict, body_content)
     """
-    if not content.startswith("---"):
+    if not content.startswith("---\n"):
         return {}, content
     
-    # Find the closing ---
-    match = re.search(r'^---\n(.*?)\n---\n(.*)', content, re.DOTALL | re.MULTILINE)
-    if match:
+    # Find the closing --- (a plain substring scan, no regex needed)
+    end = content.find("\n---\n", 4)
+    if end < 0:
+        return {}, content
+    try:
+        metadata = yaml.load(content[4:end], Loader=_YamlLoader)
+    except yaml.YAMLError:
+        return {}, content
+    return (metadata if metadata else {}, content[end + 5:])
+
+
+class _LazyRefs(Mapping):
+    """Reference docs of a skill, keyed by file stem, read from disk on first access.
+
+    Listing or counting references costs no file reads; each document is read
+    once, the first time it is looked up.
+    """
+
+    def __init__(self, refs_dir: Union[str, Path]):
+        self._paths: Dict[str, str] = {}
+        self._texts: Dict[str, str] = {}
         try:
-            metadata = yaml.safe_load(match.group(1))
-            body = match.group(2)
-            return (metadata if metadata else {}, body)
-        except yaml.YAMLError:
-            return {}, content
-    return {}, content
+            with os.scandir(refs_dir) as it:
+                for entry in it:
+                    if (entry.name.endswith(".md") and entry.name != "SKILL.md"
+                            and entry.is_file(follow_symlinks=False)):
+                        self._paths[entry.name[:-3]] = entry.path
+        except FileNotFoundError:
+            pass
+
+    def __getitem__(self, name: str) -> str:
+        text = self._texts.get(name)
+        if text is None:
+            with open(self._paths[name], "rb") as f:
+                text = self._texts[name] = _decode_text(f.read())
+        return text
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
 
+    def __repr__(self) -> str:
+        return f"_LazyRefs({list(self._paths)})"
 
-def load_skill(skill_dir: Path) -> Optional[Dict[str, Any]]:
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 file bytes with the newline translation text-mode reads would do."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def load_skill(skill_dir: Union[str, Path]) -> Optional[Dict[str, Any]]:
     """Load a single skill from its directory.
     
     Args:
-        skill_dir: Path to the skill directory
+        skill_dir: Path to the skill directory (a plain string is fine)
         
     Returns:
         Skill dictionary with metadata and content, or None if invalid
     """
-    skill_file = skill_dir / "SKILL.md"
-    if not skill_file.exists():
-        return None
+    skill_dir = os.fspath(skill_dir)
+    dir_name = os.path.basename(skill_dir)
     
     try:
-        content = skill_file.read_text(encoding="utf-8")
+        # One binary read + decode; a missing SKILL.md means "not a skill"
+        try:
+            with open(os.path.join(skill_dir, "SKILL.md"), "rb") as f:
+                content = _decode_text(f.read())
+        except FileNotFoundError:
+            return None
         metadata, body = parse_yaml_frontmatter(content)
         
-        # Extract references if any
-        references = {}
-        refs_dir = skill_dir / "references"
-        if refs_dir.exists():
-            for ref_file in refs_dir.glob("*.md"):
-                if ref_file.name != "SKILL.md":
-                    references[ref_file.stem] = ref_file.read_text(encoding="utf-8")
+        # Reference docs are only listed here and read when first accessed
+        references = _LazyRefs(os.path.join(skill_dir, "references"))
+        
+        # "Bash(playwright-cli:*)" -> "playwright-cli:*", parsed once here
+        allowed_tools = metadata.get("allowed-tools", "")
+        match = _TOOL_PATTERN_RE.match(allowed_tools) if isinstance(allowed_tools, str) else None
+        tool_pattern = match.group(1) if match else None
+        
+        # YAML can give a numeric name (name: 2024) or a null description
+        name = str(metadata.get("name") or dir_name)
+        description = str(metadata.get("description") or "")
         
         return {
-            "name": metadata.get("name", skill_dir.name),
-            "description": metadata.get("description", ""),
-            "allowed_tools": metadata.get("allowed-tools", ""),
+            "name": name,
+            "description": description,
+            "allowed_tools": allowed_tools,
+            "tool_pattern": tool_pattern,
             "body": body,
             "references": references,
-            "path": str(skill_dir),
+            "path": skill_dir,
         }
     except Exception as e:
-        print(f"Error loading skill {skill_dir.name}: {e}")
+        print(f"Error loading skill {dir_name}: {e}")
         return None
 
 
-def load_all_skills() -> Dict[str, Dict[str, Any]]:
+def _skills_signature(skills_dir: Optional[Path] = None) -> tuple:
+    """Return the sorted (path, st_mtime_ns) of every markdown file of every skill.
+
+    This only stats files, so it is much cheaper than loading the skills,
+    and it changes whenever a skill or reference is added, removed or edited.
+    """
+    signature = []
+    try:
+        with os.scandir(skills_dir or _skills_dir()) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                for sub_dir in (entry.path, os.path.join(entry.path, "references")):
+                    try:
+                        with os.scandir(sub_dir) as files:
+                            for f in files:
+                                if f.name.endswith(".md") and f.is_file(follow_symlinks=False):
+                                    signature.append((f.path, f.stat().st_mtime_ns))
+                    except FileNotFoundError:
+                        pass
+    except FileNotFoundError:
+        pass
+    return tuple(sorted(signature))
+
+
+def load_all_skills(force_reload: bool = False) -> Dict[str, Dict[str, Any]]:
     """Load all skills from the skills directory.
-    
+
+    The result is cached and only rebuilt when a skill file changes on disk
+    (see ``_skills_signature``), so repeated calls are cheap.
+
+    Args:
+        force_reload: Ignore the cache and reload every skill from disk
+
     Returns:
         Dictionary mapping skill names to skill data
     """
+    skills_dir = _skills_dir()
+    signature = _skills_signature(skills_dir)
+    cached = _skills_cache.get(str(skills_dir))
+    if not force_reload and cached is not None and cached[0] == signature:
+        return cached[1]
+
     skills = {}
     
-    if not SKILLS_DIR.exists():
-        print(f"Skills directory not found: {SKILLS_DIR}")
-        return skills
-    
-    for skill_dir in SKILLS_DIR.iterdir():
-        if skill_dir.is_dir():
-            skill = load_skill(skill_dir)
-            if skill:
-                skills[skill["name"]] = skill
-                print(f"Loaded skill: {skill['name']}")
-    
+    # DirEntry.is_dir() is answered from the directory listing, so unlike
+    # Path.iterdir() + is_dir() this does not stat every entry
+    try:
+        with os.scandir(skills_dir) as it:
+            skill_dirs = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        print(f"Skills directory not found: {skills_dir}")
+        skill_dirs = []
+    
+    # Skills are independent files, so read them concurrently; map() keeps
+    # the directory order for the results (and the log lines)
+    if skill_dirs:
+        with ThreadPoolExecutor(max_workers=min(8, len(skill_dirs))) as pool:
+            for skill in pool.map(load_skill, skill_dirs):
+                if skill:
+                    skills[skill["name"]] = skill
+                    print(f"Loaded skill: {skill['name']}")
+    
+    _skills_cache[str(skills_dir)] = (signature, skills)
     return skills
 
 
+def _shared_skills() -> Dict[str, Dict[str, Any]]:
+    """Return the skills held by the global SkillManager, so all callers share one load."""
+    # Imported here because the manager module imports this one
+    from .manager import get_skill_manager
+    return get_skill_manager().load_skills()
+
+
 def generate_skill_inventory(skills: Dict[str, Dict[str, Any]]) -> str:
     """Generate a formatted inventory of available skills.
     
@@ -113,19 +259,25 @@ def generate_skill_inventory(skills: Dict[str, Dict[str, Any]]) -> str:
     if not skills:
         return "No skills available."
     
-    inventory = "## AVAILABLE SKILLS\n\n"
-    inventory += "The following skills are available in the system:\n\n"
+    parts = [
+        "## AVAILABLE SKILLS\n\n"
+        "The following skills are available in the system:\n\n"
+    ]
     
     for name, skill in skills.items():
-        inventory += f"### {name}\n"
-        inventory += f"- **Description**: {skill.get('description', 'No description')}\n"
-        inventory += f"- **Allowed Tools**: {skill.get('allowed_tools', 'None specified')}\n"
-        inventory += "\n"
+        parts.append(
+            f"### {name}\n"
+            f"- **Description**: {skill.get('description', 'No description')}\n"
+            f"- **Allowed Tools**: {skill.get('allowed_tools', 'None specified')}\n"
+            "\n"
+        )
     
-    inventory += "To use a skill, mention its name and describe what you want to accomplish.\n"
-    inventory += "The assistant will automatically leverage the appropriate skill's capabilities.\n"
+    parts.append(
+        "To use a skill, mention its name and describe what you want to accomplish.\n"
+        "The assistant will automatically leverage the appropriate skill's capabilities.\n"
+    )
     
-    return inventory
+    return "".join(parts)
 
 
 def generate_skill_usage_guide(skills: Dict[str, Dict[str, Any]]) -> str:
@@ -137,29 +289,32 @@ def generate_skill_usage_guide(skills: Dict[str, Dict[str, Any]]) -> str:
     Returns:
         Formatted usage guide
     """
-    guide = "## SKILL USAGE GUIDE\n\n"
-    guide += "### Referencing Skills\n\n"
-    guide += "When a skill is loaded, you can reference it by name in your prompts:\n\n"
-    guide += "- **Direct mention**: \"Use playwright-cli to navigate to example.com\"\n"
-    guide += "- **Command execution**: The assistant will use the skill's allowed tools\n"
-    guide += "- **Reference documentation**: Some skills have detailed reference docs\n\n"
-    guide += "### Skill Features\n\n"
+    parts = [
+        "## SKILL USAGE GUIDE\n\n"
+        "### Referencing Skills\n\n"
+        "When a skill is loaded, you can reference it by name in your prompts:\n\n"
+        "- **Direct mention**: \"Use playwright-cli to navigate to example.com\"\n"
+        "- **Command execution**: The assistant will use the skill's allowed tools\n"
+        "- **Reference documentation**: Some skills have detailed reference docs\n\n"
+        "### Skill Features\n\n"
+    ]
     
     for name, skill in skills.items():
         references = skill.get("references", {})
         if references:
-            guide += f"**{name}** has detailed references for:\n"
-            for ref_name in references.keys():
-                guide += f"- {ref_name}\n"
-            guide += "\n"
+            parts.append(f"**{name}** has detailed references for:\n")
+            parts.extend(f"- {ref_name}\n" for ref_name in references.keys())
+            parts.append("\n")
     
-    guide += "### Best Practices\n\n"
-    guide += "1. Mention the skill name when asking about related tasks\n"
-    guide += "2. Check the skill description to understand available capabilities\n"
-    guide += "3. Reference docs provide detailed command syntax and examples\n"
-    guide += "4. Some skills may require initialization (e.g., `playwright-cli open`)\n"
+    parts.append(
+        "### Best Practices\n\n"
+        "1. Mention the skill name when asking about related tasks\n"
+        "2. Check the skill description to understand available capabilities\n"
+        "3. Reference docs provide detailed command syntax and examples\n"
+        "4. Some skills may require initialization (e.g., `playwright-cli open`)\n"
+    )
     
-    return guide
+    return "".join(parts)
 
 
 @llm.tool
@@ -169,20 +324,22 @@ def list_skills() -> str:
     Returns:
         Formatted list of available skills with descriptions
     """
-    skills = load_all_skills()
+    skills = _shared_skills()
     
     if not skills:
         return "No skills loaded."
     
-    output = "Available Skills:\n\n"
+    parts = ["Available Skills:\n\n"]
     for name, skill in skills.items():
-        output += f"  {name}:\n"
-        output += f"    Description: {skill.get('description', 'N/A')}\n"
-        output += f"    Allowed Tools: {skill.get('allowed_tools', 'N/A')}\n"
-        output += f"    References: {len(skill.get('references', {}))} docs\n"
-        output += "\n"
+        parts.append(
+            f"  {name}:\n"
+            f"    Description: {skill.get('description', 'N/A')}\n"
+            f"    Allowed Tools: {skill.get('allowed_tools', 'N/A')}\n"
+            f"    References: {len(skill.get('references', {}))} docs\n"
+            "\n"
+        )
     
-    return output
+    return "".join(parts)
 
 
 @llm.tool
@@ -195,30 +352,31 @@ def get_skill_info(skill_name: str) -> str:
     Returns:
         Detailed skill information including body and available references
     """
-    skills = load_all_skills()
+    skills = _shared_skills()
     
     if skill_name not in skills:
         return f"Skill '{skill_name}' not found. Available skills: {', '.join(skills.keys())}"
     
     skill = skills[skill_name]
-    output = f"## {skill_name}\n\n"
-    output += f"**Description**: {skill.get('description', 'N/A')}\n\n"
-    output += f"**Allowed Tools**: {skill.get('allowed_tools', 'N/A')}\n\n"
+    parts = [
+        f"## {skill_name}\n\n"
+        f"**Description**: {skill.get('description', 'N/A')}\n\n"
+        f"**Allowed Tools**: {skill.get('allowed_tools', 'N/A')}\n\n"
+    ]
     
     if skill.get("body"):
-        output += "### Overview\n\n"
-        output += skill["body"][:2000] + "\n\n"  # Limit to first 2000 chars
+        parts.append("### Overview\n\n")
+        parts.append(skill["body"][:2000] + "\n\n")  # Limit to first 2000 chars
         if len(skill["body"]) > 2000:
-            output += "*... (content truncated, use references for full details)*\n\n"
+            parts.append("*... (content truncated, use references for full details)*\n\n")
     
     references = skill.get("references", {})
     if references:
-        output += "### Available References\n\n"
+        parts.append("### Available References\n\n")
         for ref_name, ref_content in references.items():
-            output += f"#### {ref_name}\n"
-            output += ref_content[:500] + "\n\n"  # Preview first 500 chars
+            parts.append(f"#### {ref_name}\n{ref_content[:500]}\n\n")  # Preview first 500 chars
     
-    return output
+    return "".join(parts)
 
 
 def load_skill_tool(skill: Dict[str, Any]) -> Any:
@@ -269,14 +427,19 @@ def build_system_prompt_with_skills() -> str:
     Returns:
         Complete system prompt including base prompt and skill information
     """
+    global _system_prompt_cache
+    
     # Load base prompt
-    base_prompt_path = Path(PROJECT_ROOT) / "prompts" / "system.md"
-    base_prompt = ""
-    if base_prompt_path.exists():
-        base_prompt = base_prompt_path.read_text(encoding="utf-8")
+    base_prompt = _read_base_prompt()
     
     # Load skills
-    skills = load_all_skills()
+    skills = _shared_skills()
+    
+    # Both come back as the same objects while system.md and the skill
+    # files are unchanged, so the previous prompt can be reused as-is
+    cached = _system_prompt_cache
+    if cached is not None and cached[0] is base_prompt and cached[1] is skills:
+        return cached[2]
     
     # Build skill sections
     skill_inventory = generate_skill_inventory(skills)
@@ -294,16 +457,12 @@ def build_system_prompt_with_skills() -> str:
     
     full_prompt += "\n\n" + skill_writing
     
+    _system_prompt_cache = (base_prompt, skills, full_prompt)
     return full_prompt
 
 
-def generate_skill_writing_guide() -> str:
-    """Generate documentation on how to write a new skill.
-    
-    Returns:
-        Complete guide for creating new skills
-    """
-    guide = """## WRITING NEW SKILLS
+# Static guide text, returned as-is by generate_skill_writing_guide()
+_SKILL_WRITING_GUIDE = """## WRITING NEW SKILLS
 
 ### Overview
 Skills extend the CLI's capabilities by defining new tools and workflows. Each skill is a self-contained package in the `.claude/skills/` directory.
@@ -434,8 +593,15 @@ Skills are automatically:
 - **Session management**: Handle persistent connections or state
 - **Multi-step workflows**: Chain commands for complex operations
 """
+
+
+def generate_skill_writing_guide() -> str:
+    """Generate documentation on how to write a new skill.
     
-    return guide
+    Returns:
+        Complete guide for creating new skills
+    """
+    return _SKILL_WRITING_GUIDE
 
 
 def update_system_md_with_skills() -> str:
@@ -444,23 +610,5 @@ def update_system_md_with_skills() -> str:
     Returns:
         Complete updated system.md content
     """
-    base_path = Path(PROJECT_ROOT) / "prompts" / "system.md"
-    base_content = ""
-    if base_path.exists():
-        base_content = base_path.read_text(encoding="utf-8")
-    
-    # Build skill sections
-    skills = load_all_skills()
-    skill_inventory = generate_skill_inventory(skills)
-    skill_usage = generate_skill_usage_guide(skills)
-    skill_writing = generate_skill_writing_guide()
-    
-    # Append to base content
-    updated = base_content
-    if skills:
-        updated += "\n\n" + skill_inventory
-        updated += "\n\n" + skill_usage
-    
-    updated += "\n\n" + skill_writing
-    
-    return updated
+    # Same content as the full system prompt, so share its cache
+    return build_system_prompt_with_skills()
@@ -4,9 +4,13 @@ This module provides a manager class for handling skill lifecycle operations,
 including loading, tracking, and executing skills efficiently.
 """
 
-import os
 import json
+import itertools
+import threading
+from collections import defaultdict
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Set, Callable
 from .loader import (
     load_skill,
@@ -14,14 +18,29 @@ from .loader import (
     generate_skill_inventory,
     generate_skill_usage_guide,
     generate_skill_writing_guide,
-    parse_yaml_frontmatter
+    parse_yaml_frontmatter,
+    _skills_dir,
+    _skills_signature,
 )
 
+# orjson (optional) serializes the cache several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Get the current working directory
-PROJECT_ROOT = os.getcwd()
-SKILLS_DIR = Path(PROJECT_ROOT) / ".claude" / "skills"
-SKILL_CACHE_FILE = Path(PROJECT_ROOT) / ".claude" / "skill_cache.json"
+
+def _skill_cache_file() -> Path:
+    """Default cache file: skill_cache.json next to the skills directory (.claude/)."""
+    return _skills_dir().parent / "skill_cache.json"
+
+
+def _json_default(obj: Any) -> Any:
+    """Let json.dump write the lazy reference mappings as plain dicts."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class SkillManager:
@@ -40,15 +59,22 @@ class SkillManager:
             skill_enabled_checker: Optional function to check if a skill is enabled.
                                  Takes skill name and returns bool. If None, all skills enabled.
         """
-        self.skills_dir = skills_dir or SKILLS_DIR
+        self.skills_dir = skills_dir or _skills_dir()
         self._skills: Dict[str, Dict[str, Any]] = {}
         self._tool_map: Dict[str, List[str]] = {}  # tool_pattern -> [skill_names]
         self._cache: Optional[Dict] = None
         self._cache_valid = False
         self._skill_enabled_checker = skill_enabled_checker
+        # (skills dict, enabled skill names, text) of the last generate_prompt_context()
+        self._prompt_context_cache: Optional[tuple] = None
+        # (skills dict, [(name_lower, description_lower, skill), ...]) for keyword search
+        self._keyword_index_cache: Optional[tuple] = None
         
     def load_skills(self, force_reload: bool = False) -> Dict[str, Dict[str, Any]]:
         """Load all skills, using cache if available.
+
+        The cache is only used while no skill file has changed on disk since
+        it was built.
         
         Args:
             force_reload: Skip cache and reload from disk
@@ -56,7 +82,10 @@ class SkillManager:
         Returns:
             Dictionary of skill data
         """
-        if not force_reload and self._cache_valid and self._cache:
+        # Lists rather than tuples so it compares equal after a JSON round trip
+        signature = [list(item) for item in _skills_signature(self.skills_dir)]
+        if (not force_reload and self._cache_valid and self._cache
+                and self._cache.get("signature") == signature):
             self._skills = self._cache.get("skills", {})
             self._tool_map = self._cache.get("tool_map", {})
             return self._skills
@@ -66,24 +95,23 @@ class SkillManager:
         self._tool_map = {}
         
         # Load skills from disk
-        skills = load_all_skills()
+        skills = load_all_skills(force_reload=force_reload)
         self._skills = skills
         
-        # Build tool map for efficient lookup
+        # Build tool map for efficient lookup (patterns are parsed by load_skill)
+        tool_map = defaultdict(list)
         for name, skill in skills.items():
-            allowed_tools = skill.get("allowed_tools", "")
-            if allowed_tools and allowed_tools.startswith("Bash("):
-                # Extract pattern like "playwright-cli:*" from "Bash(playwright-cli:*)"
-                pattern = allowed_tools[5:-1]  # Remove "Bash(" and ")"
-                if pattern not in self._tool_map:
-                    self._tool_map[pattern] = []
-                self._tool_map[pattern].append(name)
+            pattern = skill.get("tool_pattern")
+            if pattern:
+                tool_map[pattern].append(name)
+        self._tool_map = dict(tool_map)
         
         # Cache the skills
         self._cache = {
             "skills": self._skills,
             "tool_map": self._tool_map,
             "loaded_at": str(Path.cwd()),
+            "signature": signature,
         }
         self._cache_valid = True
         
@@ -115,11 +143,12 @@ class SkillManager:
             self.load_skills()
         return self._tool_map.get(tool_pattern, [])
     
-    def find_skills_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
+    def find_skills_by_keyword(self, keyword: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Find skills matching a keyword in name or description.
         
         Args:
             keyword: Keyword to search for
+            limit: Stop after this many matches (None returns all of them)
             
         Returns:
             List of matching skill data
@@ -128,14 +157,24 @@ class SkillManager:
             self.load_skills()
         
         keyword_lower = keyword.lower()
-        results = []
-        
-        for name, skill in self._skills.items():
-            if (keyword_lower in name.lower() or 
-                keyword_lower in skill.get("description", "").lower()):
-                results.append(skill)
-        
-        return results
+        matches = (
+            skill for name_lower, desc_lower, skill in self._keyword_index()
+            if keyword_lower in name_lower or keyword_lower in desc_lower
+        )
+        # islice stops pulling from the generator, so the scan ends at the limit
+        return list(itertools.islice(matches, limit))
+    
+    def _keyword_index(self) -> List[tuple]:
+        """Return (name_lower, description_lower, skill) per skill, lowercased once per load."""
+        cached = self._keyword_index_cache
+        if cached is not None and cached[0] is self._skills:
+            return cached[1]
+        index = [
+            (str(name).lower(), str(skill.get("description") or "").lower(), skill)
+            for name, skill in self._skills.items()
+        ]
+        self._keyword_index_cache = (self._skills, index)
+        return index
     
     def get_all_tool_patterns(self) -> List[str]:
         """Get all available tool patterns from skills.
@@ -164,16 +203,18 @@ class SkillManager:
         
         allowed_tools = skill.get("allowed_tools", "None")
         
-        result = f"Executing '{task}' using {skill_name} skill.\n\n"
-        result += f"Skill Description: {skill.get('description', 'N/A')}\n"
-        result += f"Allowed Tools: {allowed_tools}\n"
+        parts = [
+            f"Executing '{task}' using {skill_name} skill.\n\n"
+            f"Skill Description: {skill.get('description', 'N/A')}\n"
+            f"Allowed Tools: {allowed_tools}\n"
+        ]
         
         if context:
-            result += f"\nContext: {context}\n"
+            parts.append(f"\nContext: {context}\n")
         
-        result += f"\nFull documentation is available in the skill references."
+        parts.append("\nFull documentation is available in the skill references.")
         
-        return result
+        return "".join(parts)
     
     def generate_prompt_context(self) -> str:
         """Generate skill context for the system prompt.
@@ -193,10 +234,19 @@ class SkillManager:
                 if self._skill_enabled_checker(name)
             }
 
+        # Reuse the last text while neither the loaded skills nor the enabled
+        # set changed; any reload replaces self._skills with a new dict
+        names = tuple(filtered_skills)
+        cached = self._prompt_context_cache
+        if cached is not None and cached[0] is self._skills and cached[1] == names:
+            return cached[2]
+
         inventory = generate_skill_inventory(filtered_skills)
         usage = generate_skill_usage_guide(filtered_skills)
 
-        return inventory + "\n\n" + usage
+        context = inventory + "\n\n" + usage
+        self._prompt_context_cache = (self._skills, names, context)
+        return context
     
     def generate_skill_writer_guide(self) -> str:
         """Generate guide for skill writers.
@@ -218,15 +268,17 @@ class SkillManager:
         if not self._skills:
             return "No skills loaded."
         
-        output = "Available Skills:\n\n"
+        parts = ["Available Skills:\n\n"]
         for name, skill in self._skills.items():
-            output += f"  {name}:\n"
-            output += f"    Description: {skill.get('description', 'N/A')}\n"
-            output += f"    Allowed Tools: {skill.get('allowed_tools', 'N/A')}\n"
-            output += f"    References: {len(skill.get('references', {}))} docs\n"
-            output += "\n"
-        
-        return output
+            parts.append(
+                f"  {name}:\n"
+                f"    Description: {skill.get('description', 'N/A')}\n"
+                f"    Allowed Tools: {skill.get('allowed_tools', 'N/A')}\n"
+                f"    References: {len(skill.get('references', {}))} docs\n"
+                "\n"
+            )
+        
+        return "".join(parts)
     
     def get_skill_references(self, skill_name: str) -> Dict[str, str]:
         """Get all references for a skill.
@@ -265,15 +317,16 @@ class SkillManager:
             self.load_skills()
         return list(self._skills.keys())
     
-    def get_tool_map(self) -> Dict[str, List[str]]:
+    def get_tool_map(self) -> Mapping[str, List[str]]:
         """Get mapping of tool patterns to skills.
         
         Returns:
-            Dictionary of tool_pattern -> [skill_names]
+            Read-only view of tool_pattern -> [skill_names]; use
+            dict(...) on it if you need a copy to modify
         """
         if not self._skills:
             self.load_skills()
-        return self._tool_map.copy()
+        return MappingProxyType(self._tool_map)
     
     def clear_cache(self) -> None:
         """Clear the skill cache."""
@@ -281,6 +334,8 @@ class SkillManager:
         self._cache_valid = False
         self._skills = {}
         self._tool_map = {}
+        self._prompt_context_cache = None
+        self._keyword_index_cache = None
     
     def save_cache(self, cache_file: Optional[Path] = None) -> None:
         """Save skill cache to file.
@@ -291,11 +346,17 @@ class SkillManager:
         if not self._cache_valid or not self._cache:
             self.load_skills()
         
-        cache_file = cache_file or SKILL_CACHE_FILE
+        cache_file = cache_file or _skill_cache_file()
         cache_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(self._cache, f, indent=2)
+        # Compact output: the cache holds every skill body, so indentation
+        # would add a lot of bytes for a file that is only read back by us
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self._cache, default=_json_default)
+        else:
+            data = json.dumps(self._cache, separators=(",", ":"), default=_json_default).encode("utf-8")
+        with open(cache_file, "wb") as f:
+            f.write(data)
     
     def load_cache(self, cache_file: Optional[Path] = None) -> bool:
         """Load skill cache from file.
@@ -306,15 +367,24 @@ class SkillManager:
         Returns:
             True if cache was loaded successfully
         """
-        cache_file = cache_file or SKILL_CACHE_FILE
+        cache_file = cache_file or _skill_cache_file()
         
         if not cache_file.exists():
             return False
         
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                self._cache = json.load(f)
+            with open(cache_file, "rb") as f:
+                data = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            cache = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
+            # A cache from before the last skill edit (or from an older
+            # version without a signature) would hand out stale skills
+            if cache.get("signature") != [list(item) for item in _skills_signature(self.skills_dir)]:
+                self._cache_valid = False
+                return False
+            
+            self._cache = cache
             self._skills = self._cache.get("skills", {})
             self._tool_map = self._cache.get("tool_map", {})
             self._cache_valid = True
@@ -324,6 +394,10 @@ class SkillManager:
             return False
 
 
+_skill_manager: Optional[SkillManager] = None
+_skill_manager_lock = threading.Lock()
+
+
 def get_skill_manager(skill_enabled_checker: Optional[Callable[[str], bool]] = None) -> SkillManager:
     """Get or create the global skill manager instance.
 
@@ -334,9 +408,15 @@ def get_skill_manager(skill_enabled_checker: Optional[Callable[[str], bool]] = N
     Returns:
         SkillManager instance
     """
-    if not hasattr(get_skill_manager, "_instance"):
-        get_skill_manager._instance = SkillManager(skill_enabled_checker=skill_enabled_checker)
-    return get_skill_manager._instance
+    global _skill_manager
+    manager = _skill_manager
+    if manager is None:
+        # Double-checked so only first-time creation takes the lock
+        with _skill_manager_lock:
+            if _skill_manager is None:
+                _skill_manager = SkillManager(skill_enabled_checker=skill_enabled_checker)
+            manager = _skill_manager
+    return manager
 
 
 def get_skill_info(skill_name: str) -> str:
@@ -358,21 +438,22 @@ def get_skill_info(skill_name: str) -> str:
     if not skill:
         return f"Skill '{skill_name}' not found. Available skills: {', '.join(manager.get_all_skill_names())}"
     
-    output = f"## {skill_name}\n\n"
-    output += f"**Description**: {skill.get('description', 'N/A')}\n\n"
-    output += f"**Allowed Tools**: {skill.get('allowed_tools', 'N/A')}\n\n"
+    parts = [
+        f"## {skill_name}\n\n"
+        f"**Description**: {skill.get('description', 'N/A')}\n\n"
+        f"**Allowed Tools**: {skill.get('allowed_tools', 'N/A')}\n\n"
+    ]
     
     body = skill.get('body', '')
     if body:
-        output += "### Overview\n\n"
-        output += body[:2000] + "\n\n"
+        parts.append("### Overview\n\n")
+        parts.append(body[:2000] + "\n\n")
         if len(body) > 2000:
-            output += "*... (content truncated, use references for full details)*\n\n"
+            parts.append("*... (content truncated, use references for full details)*\n\n")
     
     references = skill.get('references', {})
     if references:
-        output += "### Available References\n\n"
-        for ref_name in references.keys():
-            output += f"- {ref_name}\n"
+        parts.append("### Available References\n\n")
+        parts.extend(f"- {ref_name}\n" for ref_name in references.keys())
     
-    return output
+    return "".join(parts)
@@ -0,0 +1,56 @@
+"""Tests for SKILL.md loading and keyword search in src.utils.skills."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.skills.loader import load_skill
+from src.utils.skills.manager import SkillManager
+
+
+def _write_skill(root: Path, dir_name: str, frontmatter: str) -> Path:
+    skill_dir = root / dir_name
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(f"---\n{frontmatter}\n---\nBody\n", encoding="utf-8")
+    return skill_dir
+
+
+class LoadSkillTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_null_description_loads(self):
+        skill = load_skill(_write_skill(self.root, "empty-desc", "name: empty-desc\ndescription:"))
+        self.assertIsNotNone(skill)
+        self.assertEqual(skill["name"], "empty-desc")
+        self.assertEqual(skill["description"], "")
+
+    def test_numeric_name_loads_as_string(self):
+        skill = load_skill(_write_skill(self.root, "numbered", "name: 2024\ndescription: Yearly report"))
+        self.assertIsNotNone(skill)
+        self.assertEqual(skill["name"], "2024")
+
+    def test_keyword_search_handles_normalised_skills(self):
+        skills = {
+            s["name"]: s
+            for s in (
+                load_skill(_write_skill(self.root, "empty-desc", "name: empty-desc\ndescription:")),
+                load_skill(_write_skill(self.root, "numbered", "name: 2024\ndescription: Yearly Report")),
+            )
+        }
+        manager = SkillManager(skills_dir=self.root)
+        manager._skills = skills
+
+        self.assertEqual([s["name"] for s in manager.find_skills_by_keyword("2024")], ["2024"])
+        self.assertEqual([s["name"] for s in manager.find_skills_by_keyword("report")], ["2024"])
+        self.assertEqual([s["name"] for s in manager.find_skills_by_keyword("EMPTY")], ["empty-desc"])
+        # Search helpers stay out of the returned skill data
+        self.assertFalse(any(k.startswith("_") for k in skills["2024"]))
+
+
+if __name__ == "__main__":
+    unittest.main()